@@ -1,5 +1,6 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import os
+import json
 import logging
 import hashlib
 from pydantic import SecretStr
@@ -82,12 +83,20 @@ class GeminiClient:
             f"rate_limit={calls_per_minute}/min"
         )
 
-    def _get_cache_key(self, system: str, user: str) -> str:
-        """Generate cache key from system and user prompts."""
+    def _get_cache_key(self, system: str, user: str, response_schema: Optional[dict] = None) -> str:
+        """Generate cache key from system and user prompts (and response schema, if any)."""
         combined = f"{system}|||{user}"
+        if response_schema is not None:
+            combined += f"|||{json.dumps(response_schema, sort_keys=True)}"
         return hashlib.sha256(combined.encode()).hexdigest()
 
-    def invoke(self, system: str, user: str, bypass_cache: bool = False) -> str:
+    def invoke(
+        self,
+        system: str,
+        user: str,
+        bypass_cache: bool = False,
+        response_schema: Optional[dict] = None
+    ) -> str:
         """
         Invoke Gemini API with rate limiting and caching.
 
@@ -95,6 +104,8 @@ class GeminiClient:
             system: System prompt
             user: User prompt
             bypass_cache: Skip cache lookup and force API call
+            response_schema: Optional JSON schema the response must follow
+                             (Gemini constrained JSON mode)
 
         Returns:
             str: Model response
@@ -102,7 +113,7 @@ class GeminiClient:
         # Check cache first
         cache_key = None
         if self.enable_cache and not bypass_cache:
-            cache_key = self._get_cache_key(system, user)
+            cache_key = self._get_cache_key(system, user, response_schema)
             cached_response = self.cache_manager.get(cache_key)
             if cached_response is not None:
                 self.logger.info("Using cached response")
@@ -117,6 +128,8 @@ class GeminiClient:
             generation_config = {
                 "response_mime_type": "application/json",
             }
+            if response_schema is not None:
+                generation_config["response_schema"] = response_schema
 
             self.logger.debug(f"Calling Gemini API (cache_key={cache_key[:8] if cache_key else 'none'}...)")
             resp = self.chat.invoke(msgs, generation_config=generation_config)
@@ -132,6 +145,63 @@ class GeminiClient:
             self.logger.error(f"Gemini API call failed: {e}")
             raise
 
+    def invoke_stream(
+        self,
+        system: str,
+        user: str,
+        bypass_cache: bool = False,
+        response_schema: Optional[dict] = None
+    ) -> Iterator[str]:
+        """
+        Invoke Gemini API and yield the response text as it streams in.
+
+        Uses the same rate limiting and cache as invoke(). A cached response is
+        yielded as a single chunk; a streamed response is cached once it has
+        been fully consumed.
+
+        Args:
+            system: System prompt
+            user: User prompt
+            bypass_cache: Skip cache lookup and force API call
+            response_schema: Optional JSON schema the response must follow
+
+        Yields:
+            str: Response text chunks
+        """
+        cache_key = None
+        if self.enable_cache and not bypass_cache:
+            cache_key = self._get_cache_key(system, user, response_schema)
+            cached_response = self.cache_manager.get(cache_key)
+            if cached_response is not None:
+                self.logger.info("Using cached response")
+                yield cached_response
+                return
+
+        self.rate_limiter.wait_if_needed()
+
+        try:
+            msgs = [SystemMessage(content=system), HumanMessage(content=user)]
+            generation_config = {
+                "response_mime_type": "application/json",
+            }
+            if response_schema is not None:
+                generation_config["response_schema"] = response_schema
+
+            self.logger.debug(f"Streaming Gemini API (cache_key={cache_key[:8] if cache_key else 'none'}...)")
+            chunks: List[str] = []
+            for chunk in self.chat.stream(msgs, generation_config=generation_config):
+                text = getattr(chunk, "content", str(chunk))
+                if text:
+                    chunks.append(text)
+                    yield text
+
+            if self.enable_cache and cache_key:
+                self.cache_manager.set(cache_key, "".join(chunks))
+
+        except Exception as e:
+            self.logger.error(f"Gemini API streaming call failed: {e}")
+            raise
+
     def clear_cache(self):
         """Clear all cached responses."""
         if self.cache_manager:
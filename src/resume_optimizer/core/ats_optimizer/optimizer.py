@@ -353,10 +353,10 @@ class GeminiResumeOptimizer:
             self.logger.error(f"Failed to optimize summary with Gemini: {e}")
             return current_summary
 
-    def optimize_experience_description(self, experience: Experience, job_data: JobDescriptionData) -> List[str]:
+    def optimize_experience_description(self, experience: Experience, job_data: JobDescriptionData) -> Tuple[str, ...]:
         """Optimize experience descriptions using Gemini."""
         if not self.gemini_client or not experience.description:
-            return experience.description or []
+            return experience.description
 
         try:
             current_desc = '\n'.join(experience.description)
@@ -399,11 +399,11 @@ class GeminiResumeOptimizer:
                     if cleaned_line:
                         bullet_points.append(cleaned_line)
             
-            return bullet_points[:4] if bullet_points else experience.description
+            return tuple(bullet_points[:4]) if bullet_points else experience.description
             
         except Exception as e:
             self.logger.error(f"Failed to optimize experience description with Gemini: {e}")
-            return experience.description or []
+            return experience.description
 
     def optimize_all_experiences_batch(self, experiences: List[Experience], job_data: JobDescriptionData) -> List[Experience]:
         """
@@ -474,12 +474,18 @@ class GeminiResumeOptimizer:
             optimized_experiences = []
             for i, exp in enumerate(experiences, 1):
                 key = f"Experience_{i}"
+                optimized_exp = exp
                 if key in optimized_data and optimized_data[key]:
-                    optimized_exp = exp.model_copy(update={'description': optimized_data[key]})
-                    optimized_experiences.append(optimized_exp)
-                else:
-                    # Keep original if optimization failed for this experience
-                    optimized_experiences.append(exp)
+                    # Validate rather than model_copy so a bare string becomes
+                    # one bullet instead of one bullet per character
+                    try:
+                        optimized_exp = Experience.model_validate(
+                            {**exp.model_dump(), 'description': optimized_data[key]}
+                        )
+                    except ValueError as e:
+                        self.logger.warning(f"Ignoring malformed bullets for {key}: {e}")
+                # Keep original if optimization failed for this experience
+                optimized_experiences.append(optimized_exp)
 
             self.logger.info(f"Batch optimized {len(experiences)} experiences in single API call")
             return optimized_experiences
@@ -8,21 +8,19 @@ Implements Strategy pattern for different analysis approaches.
 import logging
 import re
 from typing import List, Set, Optional
-import spacy
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from ..models import JobDescriptionData
 from ...utils.exceptions import ParsingError
+from ...utils.nlp import load_spacy_model
 
 
 class JobDescriptionAnalyzer:
     """Analyzes job descriptions to extract key information and requirements."""
 
     def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            raise ParsingError("spaCy English model not found. Run: python -m spacy download en_core_web_sm")
+        # Shared, NER-only pipeline loaded once per process
+        self.nlp = load_spacy_model()
 
         self.logger = logging.getLogger(__name__)
         self.skill_keywords = self._load_skill_keywords()
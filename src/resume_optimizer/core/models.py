@@ -5,11 +5,13 @@ Data models for the Resume Optimizer application.
 Implements Pydantic models for validation and serialization.
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from pydantic import BaseModel, Field, field_validator, ConfigDict
+import json
 import re
 
 
@@ -28,6 +30,141 @@ class OptimizationStatus(Enum):
     FAILED = "failed"
 
 
+# Characters flatten_summary strips from the ends of a summary string
+_SUMMARY_STRIP_CHARS = '"\'{}[]'
+
+# Anything _split_skills would strip, split on, or remove from a skill item
+_SKILL_SPECIAL_RE = re.compile(
+    r'[•\u2022\u2023\u25CF\u2024·\*\|,;\n\r\-{}"\']|\bskills\b\s*:', re.IGNORECASE
+)
+
+# Runs of non-separator characters in a delimited skills string
+_SKILLS_TOKEN_RE = re.compile(r'[^•\u2022\u2023\u25CF\u2024·\*\|,;\n\r\-]+')
+
+
+def flatten_summary(val: Any) -> str:
+    """Flatten a summary that may arrive as a dict, list or JSON string.
+
+    Args:
+        val: Summary value as produced by a parser or optimizer
+
+    Returns:
+        Plain summary text
+    """
+    # Fast path: an already-clean string needs no JSON or bracket handling
+    if type(val) is str:
+        s = val.strip()
+        if s and s[0] not in _SUMMARY_STRIP_CHARS and s[-1] not in _SUMMARY_STRIP_CHARS:
+            return s
+    # If dict, extract the first value (e.g., 'optimized_summary' or 'summary')
+    if isinstance(val, dict):
+        for k in ['optimized_summary', 'summary', 'value']:
+            if k in val:
+                return flatten_summary(val[k])
+        # fallback: first value
+        if val:
+            return flatten_summary(next(iter(val.values())))
+        return ''
+    if isinstance(val, list):
+        # Join list items as sentences
+        return ' '.join(str(x).strip() for x in val if x)
+    if isinstance(val, str):
+        s = val.strip()
+        # Try to parse JSON string
+        if s.startswith('{'):
+            try:
+                parsed = json.loads(s)
+                return flatten_summary(parsed)
+            except Exception:
+                pass
+        # Remove leading/trailing brackets/quotes
+        s = s.strip('"\'{}[]')
+        return s
+    return str(val)
+
+
+def _pre_clean_skills(s: str) -> str:
+    """Remove JSON residue and leading/trailing bullets from a skills string."""
+    # Remove curly braces, quotes, and 'skills' key, and leading/trailing bullets
+    s = s.replace('{', '').replace('}', '').replace('"', '').replace("'", '')
+    s = re.sub(r'\bskills\b\s*:\s*', '', s, flags=re.IGNORECASE)
+    s = s.strip()
+    # Remove leading/trailing bullets and whitespace
+    s = re.sub(r'^[•\u2022\u2023\u25CF\u2024•·\*\|,;\n\r\-\s]+', '', s)
+    s = re.sub(r'[•\u2022\u2023\u25CF\u2024•·\*\|,;\n\r\-\s]+$', '', s)
+    return s
+
+
+def _split_skills(s: str) -> List[str]:
+    """Split a skills string on bullets, pipes, commas, semicolons and newlines."""
+    # Tokens are the runs between bullets, dots, pipes, commas, semicolons, and newlines
+    return [m.strip() for m in _SKILLS_TOKEN_RE.findall(_pre_clean_skills(s)) if m.strip()]
+
+
+def flatten_skills(val: Any) -> List[str]:
+    """Flatten skills that may arrive as a dict, list, JSON string or delimited text.
+
+    Args:
+        val: Skills value as produced by a parser or optimizer
+
+    Returns:
+        Flat list of skill strings
+    """
+    # Fast path: a list of plain strings needs no recursion or splitting
+    if type(val) is list and all(
+        type(x) is str and not _SKILL_SPECIAL_RE.search(x) for x in val
+    ):
+        return [x.strip() for x in val if x.strip()]
+    # If dict, extract 'skills' key or flatten all values
+    if isinstance(val, dict):
+        if 'skills' in val:
+            return flatten_skills(val['skills'])
+        # fallback: flatten all values
+        flat = []
+        for v in val.values():
+            flat.extend(flatten_skills(v))
+        return flat
+    # If list, flatten all items
+    if isinstance(val, list):
+        flat = []
+        for x in val:
+            flat.extend(flatten_skills(x))
+        return flat
+    # If string, try to parse as JSON array or split
+    if isinstance(val, str):
+        s = val.strip()
+        # Try to parse JSON array
+        if s.startswith('['):
+            try:
+                parsed = json.loads(s)
+                if isinstance(parsed, list):
+                    return flatten_skills(parsed)
+            except Exception:
+                pass
+        # Try to parse JSON object
+        if s.startswith('{'):
+            try:
+                parsed = json.loads(s)
+                return flatten_skills(parsed)
+            except Exception:
+                pass
+        return _split_skills(s)
+    # fallback: treat as string
+    return _split_skills(str(val))
+
+
+@lru_cache(maxsize=128)
+def _flatten_skills_cached(skills: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Memoized flatten_skills for the skill lists of ResumeData."""
+    return tuple(flatten_skills(list(skills)))
+
+
+@lru_cache(maxsize=128)
+def _flatten_summary_cached(summary: str) -> str:
+    """Memoized flatten_summary for ResumeData summaries."""
+    return flatten_summary(summary)
+
+
 class ContactInfo(BaseModel):
     """Contact information data model.
 
@@ -78,8 +215,8 @@ class Experience(BaseModel):
         duration: Human-readable duration (e.g., "May 2021 - Present", "2020-2023")
         start_date: Start date (ISO format preferred)
         end_date: End date (ISO format preferred) or None if current
-        description: List of responsibilities and achievements
-        skills_used: Technical and soft skills used in this role
+        description: Responsibilities and achievements (immutable tuple)
+        skills_used: Technical and soft skills used in this role (immutable tuple)
     """
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -88,17 +225,17 @@ class Experience(BaseModel):
     duration: Optional[str] = None
     start_date: Optional[str] = None
     end_date: Optional[str] = None
-    description: List[str] = Field(default_factory=list)
-    skills_used: List[str] = Field(default_factory=list)
+    description: Tuple[str, ...] = Field(default_factory=tuple)
+    skills_used: Tuple[str, ...] = Field(default_factory=tuple)
 
     @field_validator('description', mode='before')
     @classmethod
-    def ensure_description_list(cls, v):
-        """Ensure description is always a list."""
+    def ensure_description_tuple(cls, v):
+        """Ensure description is always a tuple."""
         if v is None:
-            return []
+            return ()
         if isinstance(v, str):
-            return [v]
+            return (v,)
         return v
 
 
@@ -163,6 +300,23 @@ class ResumeData(BaseModel):
     file_type: Optional[FileType] = None
     created_at: datetime = Field(default_factory=datetime.now)
 
+    def flat_skills(self) -> List[str]:
+        """Return skills flattened to a list of strings.
+
+        Results are memoized per skills value outside the model, so models
+        still compare equal by their fields alone.
+        """
+        skills = self.skills
+        if type(skills) is list and all(type(skill) is str for skill in skills):
+            return list(_flatten_skills_cached(tuple(skills)))
+        return flatten_skills(skills)
+
+    def flat_summary(self) -> str:
+        """Return the summary flattened to plain text, memoized per summary value."""
+        if type(self.summary) is str:
+            return _flatten_summary_cached(self.summary)
+        return flatten_summary(self.summary)
+
 
 class JobDescriptionData(BaseModel):
     """Job description data model.
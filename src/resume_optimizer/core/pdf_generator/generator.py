@@ -5,9 +5,17 @@ PDF Generator module for creating ATS-compliant resume PDFs.
 Implements Factory and Template Method patterns.
 """
 
+import io
 import logging
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Dict
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -19,24 +27,155 @@ from ..models import ResumeData, OptimizationResult
 from ...utils.exceptions import FileProcessingError
 
 
+logger = logging.getLogger(__name__)
+
+# Guards lazy construction of the shared styles and factory instances
+_SHARED_LOCK = threading.RLock()
+
+# Escapes the characters ReportLab's paragraph markup parser treats specially
+_HTML_ESCAPE_TBL = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+def _escape(text: object) -> str:
+    """Escape user or LLM text so ReportLab renders it literally, not as markup."""
+    return str(text).translate(_HTML_ESCAPE_TBL)
+
+
+# Optional resume sections in render order: (ResumeData field, builder method)
+_SECTIONS = (
+    ('summary', '_add_summary'),
+    ('skills', '_add_skills'),
+    ('experience', '_add_experience'),
+    ('education', '_add_education'),
+    ('certifications', '_add_certifications'),
+)
+
+
+@lru_cache(maxsize=32)
+def _section_plan(shape: Tuple[bool, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Return the sections to render for a resume shape (one flag per section)."""
+    return tuple(section for section, present in zip(_SECTIONS, shape) if present)
+
+
+# One batch job: (resume_data, optimization_result, output_path, applicant_name, company_name)
+PDFJob = Tuple[ResumeData, OptimizationResult, Path, str, str]
+
+
+def _render_worker(generator_cls: type, job: PDFJob) -> Path:
+    """Render one batch job in a worker process."""
+    return generator_cls().generate_pdf(*job)
+
+
 class ATSFriendlyPDFGenerator:
     """
     Generates ATS-friendly PDF resumes using ReportLab.
     Follows ATS best practices for formatting and structure.
     """
 
+    _shared_styles: Optional[Dict[str, ParagraphStyle]] = None
+
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self.styles = self._create_ats_styles()
+        # Styles are never mutated after creation, so build them once per class
+        # and share them across every generator instance.
+        cls = type(self)
+        if cls.__dict__.get('_shared_styles') is None:
+            with _SHARED_LOCK:
+                if cls.__dict__.get('_shared_styles') is None:
+                    cls._shared_styles = self._create_ats_styles()
+        self.styles = cls._shared_styles
         self.page_size = letter  # Standard US letter size for ATS compatibility
 
     def generate_pdf(self, resume_data: ResumeData, optimization_result: OptimizationResult, 
                     output_path: Path, applicant_name: str, company_name: str) -> Path:
-        """Generate ATS-compliant PDF resume."""
+        """Generate ATS-compliant PDF resume.
+
+        The document is streamed into a temp file next to ``output_path`` and
+        renamed over it only once the build succeeds, so a failed build leaves
+        no partial file behind.
+        """
+        output_path = Path(output_path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.tmp')
+        except OSError as e:
+            logger.error(f"Failed to write PDF: {e}")
+            raise FileProcessingError(f"PDF generation failed: {e}")
+        try:
+            with os.fdopen(fd, 'wb') as fileobj:
+                self.generate_pdf_to_stream(
+                    resume_data, optimization_result, fileobj, applicant_name, company_name
+                )
+            os.replace(tmp_path, output_path)
+        except OSError as e:
+            os.unlink(tmp_path)
+            logger.error(f"Failed to write PDF: {e}")
+            raise FileProcessingError(f"PDF generation failed: {e}")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        logger.info(f"PDF generated successfully: {output_path}")
+        return output_path
+
+    def generate_many(self, jobs: Sequence[PDFJob], max_workers: Optional[int] = None) -> List[Path]:
+        """Generate several PDFs in parallel, one worker process per CPU by default.
+
+        Each job carries the same arguments as generate_pdf. Layout is CPU-bound
+        and the documents are independent, so they are rendered in separate
+        processes rather than threads. Workers are spawned, never forked, as
+        callers such as the Streamlit server are multi-threaded.
+
+        Args:
+            jobs: Batch of (resume_data, optimization_result, output_path,
+                applicant_name, company_name) tuples
+            max_workers: Worker process count (default: os.cpu_count())
+
+        Returns:
+            Output paths in the same order as ``jobs``
+
+        Raises:
+            FileProcessingError: If any PDF fails to generate
+        """
+        if len(jobs) <= 1:
+            return [self.generate_pdf(*job) for job in jobs]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+            return list(executor.map(_render_worker, [type(self)] * len(jobs), jobs))
+
+    def generate_pdf_bytes(self, resume_data: ResumeData, optimization_result: OptimizationResult,
+                           applicant_name: str, company_name: str) -> bytes:
+        """Generate ATS-compliant PDF resume in memory and return its bytes.
+
+        Raises:
+            FileProcessingError: If PDF generation fails
+        """
+        buffer = io.BytesIO()
+        self.generate_pdf_to_stream(
+            resume_data, optimization_result, buffer, applicant_name, company_name
+        )
+        return buffer.getvalue()
+
+    def generate_pdf_to_stream(self, resume_data: ResumeData, optimization_result: OptimizationResult,
+                               fileobj: BinaryIO, applicant_name: str, company_name: str) -> None:
+        """Generate ATS-compliant PDF resume into a writable binary file object.
+
+        Lets callers hand the PDF straight to an HTTP response or an in-memory
+        buffer without a round trip through the filesystem.
+
+        Args:
+            resume_data: Resume content to render
+            optimization_result: Optimization result for this resume
+            fileobj: Writable binary file-like object (e.g. io.BytesIO)
+            applicant_name: Name to print in the header
+            company_name: Target company name
+
+        Raises:
+            FileProcessingError: If PDF generation fails
+        """
         try:
             # Create PDF document
             doc = SimpleDocTemplate(
-                str(output_path),
+                fileobj,
                 pagesize=self.page_size,
                 rightMargin=0.75*inch,
                 leftMargin=0.75*inch,
@@ -45,41 +184,26 @@ class ATSFriendlyPDFGenerator:
             )
 
             # Build document content
-            story = []
-
-            # Add header
-            self._add_header(story, resume_data, applicant_name)
-
-            # Add summary/objective
-            if resume_data.summary:
-                self._add_summary(story, resume_data.summary)
-
-            # Add skills section
-            if resume_data.skills:
-                self._add_skills(story, resume_data.skills)
-
-            # Add experience section
-            if resume_data.experience:
-                self._add_experience(story, resume_data.experience)
-
-            # Add education section
-            if resume_data.education:
-                self._add_education(story, resume_data.education)
-
-            # Add certifications if any
-            if resume_data.certifications:
-                self._add_certifications(story, resume_data.certifications)
+            story = self.build_story(resume_data, applicant_name)
 
             # Build PDF
             doc.build(story)
 
-            self.logger.info(f"PDF generated successfully: {output_path}")
-            return output_path
-
         except Exception as e:
-            self.logger.error(f"Failed to generate PDF: {e}")
+            logger.error(f"Failed to generate PDF: {e}")
             raise FileProcessingError(f"PDF generation failed: {e}")
 
+    def build_story(self, resume_data: ResumeData, applicant_name: str) -> list:
+        """Build the list of flowables for a resume, skipping empty sections."""
+        story = []
+        self._add_header(story, resume_data, applicant_name)
+
+        shape = tuple(bool(getattr(resume_data, field)) for field, _ in _SECTIONS)
+        for _, builder in _section_plan(shape):
+            getattr(self, builder)(story, resume_data)
+
+        return story
+
     def _create_ats_styles(self) -> Dict[str, ParagraphStyle]:
         """Create ATS-friendly paragraph styles."""
         styles = getSampleStyleSheet()
@@ -156,178 +280,83 @@ class ATSFriendlyPDFGenerator:
 
         # Name
         name = applicant_name or contact.name or "Your Name"
-        story.append(Paragraph(name.upper(), self.styles['name']))
+        items = [Paragraph(_escape(name.upper()), self.styles['name'])]
 
         # Contact information
-        contact_info = []
-        if contact.phone:
-            contact_info.append(contact.phone)
-        if contact.email:
-            contact_info.append(contact.email)
-        if contact.address:
-            contact_info.append(contact.address)
-
+        contact_info = [_escape(v) for v in (contact.phone, contact.email, contact.address) if v]
         if contact_info:
-            contact_text = " | ".join(contact_info)
-            story.append(Paragraph(contact_text, self.styles['contact']))
+            items.append(Paragraph(" | ".join(contact_info), self.styles['contact']))
 
         # LinkedIn and GitHub on separate line if available
         links = []
         if contact.linkedin:
-            links.append(f"LinkedIn: {contact.linkedin}")
+            links.append(f"LinkedIn: {_escape(contact.linkedin)}")
         if contact.github:
-            links.append(f"GitHub: {contact.github}")
+            links.append(f"GitHub: {_escape(contact.github)}")
 
         if links:
-            links_text = " | ".join(links)
-            story.append(Paragraph(links_text, self.styles['contact']))
+            items.append(Paragraph(" | ".join(links), self.styles['contact']))
 
-        story.append(Spacer(1, 6))
+        items.append(Spacer(1, 6))
+        story.extend(items)
 
-    def _add_summary(self, story: list, summary) -> None:
+    def _add_summary(self, story: list, resume_data: ResumeData) -> None:
         """Add professional summary section, flattening dict/JSON if needed."""
-        import json
-        def flatten_summary(val):
-            import json
-            # If dict, extract the first value (e.g., 'optimized_summary' or 'summary')
-            if isinstance(val, dict):
-                for k in ['optimized_summary', 'summary', 'value']:
-                    if k in val:
-                        return flatten_summary(val[k])
-                # fallback: first value
-                if val:
-                    return flatten_summary(next(iter(val.values())))
-                return ''
-            if isinstance(val, list):
-                # Join list items as sentences
-                return ' '.join(str(x).strip() for x in val if x)
-            if isinstance(val, str):
-                s = val.strip()
-                # Try to parse JSON string
-                if s.startswith('{'):
-                    try:
-                        parsed = json.loads(s)
-                        return flatten_summary(parsed)
-                    except Exception:
-                        pass
-                # Remove leading/trailing brackets/quotes
-                s = s.strip('"\'{}[]')
-                return s
-            return str(val)
-        section = []
-        section.append(Paragraph("PROFESSIONAL SUMMARY", self.styles['section_header']))
-        section.append(Paragraph(flatten_summary(summary), self.styles['body']))
-        section.append(Spacer(1, 6))
-        story.append(KeepTogether(section))
+        story.append(KeepTogether([
+            Paragraph("PROFESSIONAL SUMMARY", self.styles['section_header']),
+            Paragraph(_escape(resume_data.flat_summary()), self.styles['body']),
+            Spacer(1, 6),
+        ]))
 
-    def _add_skills(self, story: list, skills) -> None:
+    def _add_skills(self, story: list, resume_data: ResumeData) -> None:
         """Add skills section, flattening dict/JSON if needed."""
-        import json
-        def flatten_skills(val):
-            import re, json
-            def pre_clean(s):
-                # Remove curly braces, quotes, and 'skills' key, and leading/trailing bullets
-                s = s.replace('{', '').replace('}', '').replace('"', '').replace("'", '')
-                s = re.sub(r'\bskills\b\s*:\s*', '', s, flags=re.IGNORECASE)
-                s = s.strip()
-                # Remove leading/trailing bullets and whitespace
-                s = re.sub(r'^[•\u2022\u2023\u25CF\u2024•·\*\|,;\n\r\-\s]+', '', s)
-                s = re.sub(r'[•\u2022\u2023\u25CF\u2024•·\*\|,;\n\r\-\s]+$', '', s)
-                return s
-
-            def split_skills(s):
-                s = pre_clean(s)
-                # Split on all common separators, including bullets, dots, pipes, commas, semicolons, and newlines
-                items = re.split(r'[•\u2022\u2023\u25CF\u2024•·\*\|,;\n\r\-]+', s)
-                return [item.strip() for item in items if item and item.strip()]
-
-            # If dict, extract 'skills' key or flatten all values
-            if isinstance(val, dict):
-                if 'skills' in val:
-                    return flatten_skills(val['skills'])
-                # fallback: flatten all values
-                flat = []
-                for v in val.values():
-                    flat.extend(flatten_skills(v))
-                return flat
-            # If list, flatten all items
-            if isinstance(val, list):
-                flat = []
-                for x in val:
-                    flat.extend(flatten_skills(x))
-                return flat
-            # If string, try to parse as JSON array or split
-            if isinstance(val, str):
-                s = val.strip()
-                # Try to parse JSON array
-                if s.startswith('['):
-                    try:
-                        parsed = json.loads(s)
-                        if isinstance(parsed, list):
-                            return flatten_skills(parsed)
-                    except Exception:
-                        pass
-                # Try to parse JSON object
-                if s.startswith('{'):
-                    try:
-                        parsed = json.loads(s)
-                        return flatten_skills(parsed)
-                    except Exception:
-                        pass
-                return split_skills(s)
-            # fallback: treat as string
-            return split_skills(str(val))
-
-        section = []
-        section.append(Paragraph("TECHNICAL SKILLS", self.styles['section_header']))
-        skills_list = flatten_skills(skills)
-        skills_text = " • ".join(skills_list)
-        section.append(Paragraph(skills_text, self.styles['body']))
-        section.append(Spacer(1, 6))
-        story.append(KeepTogether(section))
-
-    def _add_experience(self, story: list, experiences: list) -> None:
+        skills_text = " • ".join(_escape(skill) for skill in resume_data.flat_skills())
+        story.append(KeepTogether([
+            Paragraph("TECHNICAL SKILLS", self.styles['section_header']),
+            Paragraph(skills_text, self.styles['body']),
+            Spacer(1, 6),
+        ]))
+
+    def _add_experience(self, story: list, resume_data: ResumeData) -> None:
         """Add work experience section."""
-        section = []
-        section.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles['section_header']))
+        section = [Paragraph("PROFESSIONAL EXPERIENCE", self.styles['section_header'])]
 
-        for exp in experiences:
+        for exp in resume_data.experience:
             exp_section = []
             # Job title and company
             if exp.position and exp.company:
-                title_text = f"<b>{exp.position}</b>"
-                exp_section.append(Paragraph(title_text, self.styles['job_title']))
-
-                company_text = f"{exp.company}"
+                company_text = exp.company
                 if exp.start_date or exp.end_date:
                     date_range = f"{exp.start_date or ''} - {exp.end_date or 'Present'}"
                     company_text += f" | {date_range}"
 
-                exp_section.append(Paragraph(company_text, self.styles['company_info']))
+                exp_section = [
+                    Paragraph(f"<b>{_escape(exp.position)}</b>", self.styles['job_title']),
+                    Paragraph(_escape(company_text), self.styles['company_info']),
+                ]
 
             # Job description
-            for desc in exp.description:
-                if desc.strip():
-                    bullet_text = f"• {desc}"
-                    exp_section.append(Paragraph(bullet_text, self.styles['bullet']))
+            bullet_style = self.styles['bullet']
+            exp_section.extend(
+                Paragraph('• ' + _escape(d), bullet_style)
+                for d in exp.description if d.strip()
+            )
 
             exp_section.append(Spacer(1, 6))
             section.append(KeepTogether(exp_section))
-        story.append(KeepTogether(section))
+        # Only individual entries are kept atomic; wrapping the whole section
+        # makes ReportLab retry the layout of every job on each page break.
+        story.extend(section)
 
-    def _add_education(self, story: list, education: list) -> None:
+    def _add_education(self, story: list, resume_data: ResumeData) -> None:
         """Add education section."""
-        section = []
-        section.append(Paragraph("EDUCATION", self.styles['section_header']))
+        section = [Paragraph("EDUCATION", self.styles['section_header'])]
 
-        for edu in education:
-            edu_section = []
+        for edu in resume_data.education:
             if edu.degree and edu.institution:
-                edu_text = f"<b>{edu.degree}</b>"
+                edu_text = f"<b>{_escape(edu.degree)}</b>"
                 if edu.field:
-                    edu_text += f" in {edu.field}"
-
-                edu_section.append(Paragraph(edu_text, self.styles['job_title']))
+                    edu_text += f" in {_escape(edu.field)}"
 
                 institution_text = edu.institution
                 if edu.graduation_date:
@@ -335,40 +364,54 @@ class ATSFriendlyPDFGenerator:
                 if edu.gpa:
                     institution_text += f" | GPA: {edu.gpa}"
 
-                edu_section.append(Paragraph(institution_text, self.styles['company_info']))
-                edu_section.append(Spacer(1, 3))
-                section.append(KeepTogether(edu_section))
-        story.append(KeepTogether(section))
+                section.append(KeepTogether([
+                    Paragraph(edu_text, self.styles['job_title']),
+                    Paragraph(_escape(institution_text), self.styles['company_info']),
+                    Spacer(1, 3),
+                ]))
+        story.extend(section)
 
-    def _add_certifications(self, story: list, certifications: list | str) -> None:
+    def _add_certifications(self, story: list, resume_data: ResumeData) -> None:
         """Add certifications section."""
-        import re
-        section = []
-        section.append(Paragraph("CERTIFICATIONS", self.styles['section_header']))
+        certifications = resume_data.certifications
+        section = [Paragraph("CERTIFICATIONS", self.styles['section_header'])]
 
         if certifications:
             if isinstance(certifications, list):
-                for cert in certifications:
-                    cert_text = f"• {cert}"
-                    section.append(Paragraph(cert_text, self.styles['bullet']))
+                cert_list = [str(c) for c in certifications]
             elif isinstance(certifications, str):
                 # Split string by bullets or newlines and format properly
                 cert_list = [c.strip() for c in re.split(r'[•\n]', certifications) if c.strip()]
-                for cert in cert_list:
-                    cert_text = f"• {cert}"
-                    section.append(Paragraph(cert_text, self.styles['bullet']))
+            else:
+                cert_list = []
+            bullet_style = self.styles['bullet']
+            section.extend(
+                Paragraph('• ' + _escape(c), bullet_style)
+                for c in cert_list
+            )
 
         section.append(Spacer(1, 6))
         story.append(KeepTogether(section))
 
 
 class PDFGeneratorFactory:
-    """Factory for creating PDF generators."""
+    """Factory for creating PDF generators.
+
+    Generators hold no per-document state, so one instance per type is
+    created and reused across generate_pdf calls.
+    """
+
+    _instances: Dict[str, ATSFriendlyPDFGenerator] = {}
 
     @staticmethod
     def create_generator(generator_type: str = "ats_friendly") -> ATSFriendlyPDFGenerator:
-        """Create a PDF generator instance."""
-        if generator_type == "ats_friendly":
-            return ATSFriendlyPDFGenerator()
-        else:
+        """Return the shared PDF generator instance for a generator type."""
+        instances = PDFGeneratorFactory._instances
+        if generator_type in instances:
+            return instances[generator_type]
+        if generator_type != "ats_friendly":
             raise ValueError(f"Unknown generator type: {generator_type}")
+        with _SHARED_LOCK:
+            if generator_type not in instances:
+                instances[generator_type] = ATSFriendlyPDFGenerator()
+        return instances[generator_type]
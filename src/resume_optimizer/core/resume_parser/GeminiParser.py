@@ -1,22 +1,512 @@
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import re
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ...utils.exceptions import ParsingError, FileProcessingError
+from ...utils.rate_limiter import CacheManager
 from ..models import ResumeData, ContactInfo, FileType, Experience, Education
 from ..ai_integration.gemini_client import GeminiClient
-from .parser import BaseResumeParser, TextExtractor
+from .parser import BaseResumeParser, TextExtractor, file_type_for
+
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    # catching the stdlib exception either way.
+    _jloads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _jloads = json.loads
+
+
+# Separators used when a list field (skills, certifications) arrives as one string
+_SPLIT_LIST_RE = re.compile(r'[,\n\u2022|;]+')
+# Separators used when an experience description arrives as one string
+_SPLIT_DESC_RE = re.compile(r'[\n\u2022]+')
+
+
+def _strip_code_fence(s: str) -> str:
+    """Remove a surrounding ```json markdown fence, if present."""
+    s = s.strip()
+    if s.startswith('```'):
+        newline = s.find('\n')
+        s = s[newline + 1:] if newline != -1 else s[3:]
+        s = s.rstrip('`').rstrip()
+    return s
+
+
+def _scan_json_object(s: str) -> Optional[str]:
+    """Return the first balanced ``{...}`` span in ``s`` using a single pass.
+
+    Braces inside JSON strings (including escaped quotes) are ignored.
+    """
+    start = s.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    return None
+
+
+class _BraceTracker:
+    """Incrementally tracks JSON brace depth across streamed chunks."""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True once the top-level object has closed."""
+        for ch in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '{':
+                self.depth += 1
+                self.started = True
+            elif ch == '}':
+                self.depth -= 1
+                if self.started and self.depth == 0:
+                    return True
+        return False
+
+
+def _try_parse_json(s: str) -> Optional[Dict[str, Any]]:
+    """Parse a model response into a dict, tolerating fences and surrounding text.
+
+    Tries the raw string, then the string without a markdown fence, then the
+    first balanced ``{...}`` span. Returns None if none of them is a JSON
+    object, so callers only go back to the model when local recovery is
+    impossible.
+    """
+    resp = s.strip()
+    try:
+        parsed = _jloads(resp)
+        if isinstance(parsed, dict):
+            return parsed
+    except ValueError:
+        pass
+
+    if resp.startswith('```'):
+        resp = _strip_code_fence(resp)
+        try:
+            parsed = _jloads(resp)
+            if isinstance(parsed, dict):
+                return parsed
+        except ValueError:
+            pass
+
+    candidate = _scan_json_object(resp)
+    if candidate is None:
+        return None
+    try:
+        parsed = _jloads(candidate)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+# Gemini schemas mark optional values with "nullable"; a ["string", "null"]
+# type list is rejected by google-genai before the request is sent
+_NULLABLE_STRING = {"type": "string", "nullable": True}
+_STRING_ARRAY = {"type": "array", "items": {"type": "string"}}
+
+# JSON schema for Gemini's constrained JSON mode; mirrors _GeminiResume below
+RESUME_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "Name": _NULLABLE_STRING,
+        "Email": _NULLABLE_STRING,
+        "Phone": _NULLABLE_STRING,
+        "LinkedIn": _NULLABLE_STRING,
+        "GitHub": _NULLABLE_STRING,
+        "Summary": _NULLABLE_STRING,
+        "Skills": _STRING_ARRAY,
+        "Experience": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "Company": _NULLABLE_STRING,
+                    "Position": _NULLABLE_STRING,
+                    "Duration": _NULLABLE_STRING,
+                    "Description": _STRING_ARRAY,
+                    "StartDate": _NULLABLE_STRING,
+                    "EndDate": _NULLABLE_STRING,
+                },
+            },
+        },
+        "Education": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "Institution": _NULLABLE_STRING,
+                    "Degree": _NULLABLE_STRING,
+                    "Field": _NULLABLE_STRING,
+                    "Year": _NULLABLE_STRING,
+                    "GPA": _NULLABLE_STRING,
+                    "Description": _STRING_ARRAY,
+                },
+            },
+        },
+        "Certifications": _STRING_ARRAY,
+        "Projects": _NULLABLE_STRING,
+    },
+    "required": ["Name", "Skills", "Experience", "Education"],
+}
+
+# Schema for batched requests: one resume object per input resume, in order
+RESUME_BATCH_RESPONSE_SCHEMA: Dict[str, Any] = {"type": "array", "items": RESUME_RESPONSE_SCHEMA}
+
+# Combined resume text above this size is parsed one resume per request
+_MAX_BATCH_CHARS = 200_000
+# Upper bound on concurrent Gemini requests when resumes are parsed individually
+_MAX_CONCURRENT_REQUESTS = 4
+
+_SYSTEM_PROMPT = (
+    "You are an expert resume parser. Extract the resume fields defined by the "
+    "response schema from the resume text. Use null for missing values and keep "
+    "each bullet point as a separate array item."
+)
+
+# System prompt for the strict second attempt when the first response is not JSON
+_STRICT_SYSTEM_PROMPT = """You MUST return a single VALID JSON object and NOTHING ELSE.
+Use the exact Title‑Case keys and structure defined by the response schema:
+"Name","Email","Phone","LinkedIn","GitHub","Summary","Skills","Experience","Education","Certifications","Projects".
+Ensure arrays and nulls are used correctly. Do NOT include any explanatory text."""
+
+# Part of the on-disk Gemini parse cache key; bump when the cached Gemini JSON
+# would change for the same resume text
+_GEMINI_CACHE_VERSION = 2
+# The prompts and schema are hashed into the key as well, so editing either one
+# never serves parses made under the old wording
+_GEMINI_CACHE_SALT = hashlib.sha256(json.dumps(
+    [_GEMINI_CACHE_VERSION, _SYSTEM_PROMPT, _STRICT_SYSTEM_PROMPT, RESUME_RESPONSE_SCHEMA],
+    sort_keys=True
+).encode('utf-8')).hexdigest()
+
+
+def _normalize_possible_json_field(value: Any) -> Any:
+    """Parse fields that may come as JSON-strings, nested JSON, dicts or lists."""
+    # If it's a string that looks like JSON, try to parse it
+    if isinstance(value, str):
+        s = value.strip()
+        if (s.startswith('{') or s.startswith('[')):
+            try:
+                parsed = _jloads(s)
+                return parsed
+            except Exception:
+                # fall through and return original string
+                return value
+    return value
+
+
+def _text_from_str(v: str, keys: Optional[List[str]]) -> str:
+    return v.strip()
+
+
+def _text_from_list(v: list, keys: Optional[List[str]]) -> str:
+    return " \n".join(str(x).strip() for x in v if x)
+
+
+def _text_from_dict(v: dict, keys: Optional[List[str]]) -> str:
+    # Prefer requested keys if provided
+    if keys:
+        for k in keys:
+            if k in v:
+                return _extract_text_from_possible_obj(v[k])
+    # fallback: join values
+    return " ".join(str(x).strip() for x in v.values() if x)
+
+
+def _text_fallback(v: Any, keys: Optional[List[str]]) -> str:
+    return str(v)
+
+
+# type(value) -> handler; one hash lookup instead of an isinstance chain
+_TEXT_HANDLERS = {
+    str: _text_from_str,
+    list: _text_from_list,
+    dict: _text_from_dict,
+    type(None): lambda v, keys: "",
+}
+
+
+def _extract_text_from_possible_obj(v: Any, keys: Optional[List[str]] = None) -> str:
+    """Return a clean string from v which can be str/list/dict.
+    If dict, prefer keys in `keys` (list) or join values.
+    If list, join elements.
+    """
+    v = _normalize_possible_json_field(v)
+    return _TEXT_HANDLERS.get(type(v), _text_fallback)(v, keys)
+
+
+def _list_from_str(v: str) -> List[str]:
+    # JSON-looking strings were already tried by _normalize_possible_json_field;
+    # split by common separators
+    return [sitem.strip() for sitem in _SPLIT_LIST_RE.split(v.strip()) if sitem.strip()]
+
+
+def _list_from_list(v: list) -> List[str]:
+    # Each item is converted and stripped once; plain strings skip str()
+    return [
+        s for x in v
+        if x is not None and (s := (x if type(x) is str else str(x)).strip())
+    ]
+
+
+def _list_from_dict(v: dict) -> List[str]:
+    # Common case: {'skills': [...]} or {'Skills': [...]}
+    for key in ('Skills', 'skills'):
+        if key in v and isinstance(v[key], list):
+            return [str(x).strip() for x in v[key] if x]
+        if key in v and isinstance(v[key], str):
+            # parse string into list
+            return [s.strip() for s in _SPLIT_LIST_RE.split(v[key]) if s.strip()]
+    # fallback: use values
+    vals = []
+    for x in v.values():
+        vals.extend(_extract_list_from_possible_obj(x))
+    return vals
+
+
+def _list_fallback(v: Any) -> List[str]:
+    return [str(v).strip()]
+
+
+_LIST_HANDLERS = {
+    str: _list_from_str,
+    list: _list_from_list,
+    dict: _list_from_dict,
+    type(None): lambda v: [],
+}
+
+
+def _extract_list_from_possible_obj(v: Any) -> List[str]:
+    """Return a list of strings from v which can be str/list/dict."""
+    v = _normalize_possible_json_field(v)
+    return _LIST_HANDLERS.get(type(v), _list_fallback)(v)
+
+
+def _text_field(v: Any) -> str:
+    return _extract_text_from_possible_obj(v)
+
+
+def _list_field(v: Any) -> List[str]:
+    # JSON mode almost always yields a real list; skip the JSON-string probe
+    if type(v) is list:
+        return _list_from_list(v)
+    if v is None:
+        return []
+    return _extract_list_from_possible_obj(v)
+
+
+def _object_list_field(v: Any) -> List[Dict[str, Any]]:
+    """Keep only the dict entries of a (possibly JSON-encoded) list field."""
+    v = _normalize_possible_json_field(v)
+    if not isinstance(v, list):
+        return []
+    return [item for item in v if isinstance(item, dict)]
+
+
+class _GeminiExperience(BaseModel):
+    """Experience entry in Gemini's Title‑Case JSON."""
+    model_config = ConfigDict(extra='ignore')
+
+    company: str = Field('', alias='Company')
+    position: str = Field('', alias='Position')
+    duration: str = Field('', alias='Duration')
+    description: List[str] = Field(default_factory=list, alias='Description')
+    start_date: Any = Field(None, alias='StartDate')
+    end_date: Any = Field(None, alias='EndDate')
+
+    @field_validator('company', 'position', 'duration', mode='before')
+    @classmethod
+    def normalize_text(cls, v: Any) -> str:
+        """Flatten JSON-ish values into plain text."""
+        return _text_field(v)
+
+    @field_validator('description', mode='before')
+    @classmethod
+    def split_description(cls, v: Any) -> List[str]:
+        """Accept a bullet/newline separated string or a list of bullets."""
+        if v is None:
+            return []
+        if isinstance(v, str):
+            return [d.strip() for d in _SPLIT_DESC_RE.split(v) if d.strip()]
+        if isinstance(v, list):
+            return [str(d).strip() for d in v if d]
+        return [str(v)]
+
+    def to_experience(self) -> Experience:
+        """Convert to the application's Experience model."""
+        return Experience(
+            company=self.company,
+            position=self.position,
+            duration=self.duration,
+            description=self.description,
+            start_date=self.start_date,
+            end_date=self.end_date
+        )
+
+
+class _GeminiEducation(BaseModel):
+    """Education entry in Gemini's Title‑Case JSON."""
+    model_config = ConfigDict(extra='ignore')
+
+    institution: str = Field('', alias='Institution')
+    degree: str = Field('', alias='Degree')
+    field: str = Field('', alias='Field')
+    year: str = Field('', alias='Year')
+    gpa: Any = Field(None, alias='GPA')
+    description: List[str] = Field(default_factory=list, alias='Description')
+
+    @field_validator('institution', 'degree', 'field', 'year', mode='before')
+    @classmethod
+    def normalize_text(cls, v: Any) -> str:
+        """Flatten JSON-ish values into plain text."""
+        return _text_field(v)
+
+    @field_validator('description', mode='before')
+    @classmethod
+    def normalize_list(cls, v: Any) -> List[str]:
+        """Flatten JSON-ish values into a list of strings."""
+        return _list_field(v)
+
+    def to_education(self) -> Education:
+        """Convert to the application's Education model."""
+        return Education(
+            institution=self.institution,
+            degree=self.degree,
+            field=self.field,
+            graduation_date=self.year,
+            gpa=self.gpa,
+            description=self.description
+        )
+
+
+class _GeminiResume(BaseModel):
+    """Top-level resume object in Gemini's Title‑Case JSON.
+
+    Validators normalise the loosely typed values Gemini sometimes returns
+    (JSON-encoded strings, dicts, delimited strings) in a single
+    model_validate pass.
+    """
+    model_config = ConfigDict(extra='ignore')
+
+    name: str = Field('', alias='Name')
+    email: str = Field('', alias='Email')
+    phone: str = Field('', alias='Phone')
+    linkedin: str = Field('', alias='LinkedIn')
+    github: str = Field('', alias='GitHub')
+    summary: str = Field('', alias='Summary')
+    skills: List[str] = Field(default_factory=list, alias='Skills')
+    experience: List[_GeminiExperience] = Field(default_factory=list, alias='Experience')
+    education: List[_GeminiEducation] = Field(default_factory=list, alias='Education')
+    certifications: List[str] = Field(default_factory=list, alias='Certifications')
+    projects: str = Field('', alias='Projects')
+
+    @field_validator('name', 'email', 'phone', 'linkedin', 'github', 'summary', 'projects', mode='before')
+    @classmethod
+    def normalize_text(cls, v: Any) -> str:
+        """Flatten JSON-ish values into plain text."""
+        return _text_field(v)
+
+    @field_validator('skills', mode='before')
+    @classmethod
+    def normalize_list(cls, v: Any) -> List[str]:
+        """Flatten JSON-ish values into a list of strings."""
+        return _list_field(v)
+
+    @field_validator('experience', 'education', mode='before')
+    @classmethod
+    def normalize_objects(cls, v: Any) -> List[Dict[str, Any]]:
+        """Drop anything that is not an object from the entry lists."""
+        return _object_list_field(v)
+
+    @field_validator('certifications', mode='before')
+    @classmethod
+    def normalize_certifications(cls, v: Any) -> List[str]:
+        """Treat a literal "null" string as no certifications."""
+        if isinstance(v, str) and v.strip().lower() == 'null':
+            return []
+        return _list_field(v)
+
+    def to_resume_data(self, raw_text: str, file_path: Optional[Path], file_type: FileType) -> ResumeData:
+        """Map the validated Gemini payload onto the ResumeData model."""
+        return ResumeData(
+            contact_info=ContactInfo(
+                name=self.name,
+                email=self.email,
+                phone=self.phone,
+                linkedin=self.linkedin,
+                github=self.github
+            ),
+            summary=self.summary,
+            skills=self.skills,
+            experience=[exp.to_experience() for exp in self.experience],
+            education=[edu.to_education() for edu in self.education],
+            certifications=self.certifications,
+            raw_text=raw_text,
+            file_path=file_path,
+            file_type=file_type
+        )
 
 
 class GeminiResumeParser(BaseResumeParser):
     """Resume parser using Gemini AI for complex resume parsing."""
 
-    def __init__(self, gemini_client: GeminiClient):
+    def __init__(
+        self,
+        gemini_client: GeminiClient,
+        enable_cache: bool = True,
+        cache_ttl_hours: int = 24
+    ):
+        """
+        Initialize the Gemini resume parser.
+
+        Args:
+            gemini_client: Configured GeminiClient used for parsing
+            enable_cache: Cache parsed resume JSON on disk (default: True)
+            cache_ttl_hours: Parsed-resume cache time-to-live in hours (default: 24)
+        """
         self.gemini_client = gemini_client
         self.logger = logging.getLogger(__name__)
         self.text_extractor = TextExtractor()
+        self.cache_manager = (
+            CacheManager(cache_dir=Path.cwd() / ".cache" / "gemini_resume", ttl_hours=cache_ttl_hours)
+            if enable_cache else None
+        )
 
     def parse(self, file_path: Path) -> ResumeData:
         """Parse resume from file and return structured data.
@@ -39,6 +529,31 @@ class GeminiResumeParser(BaseResumeParser):
             # Extract text from file
             raw_text = self._extract_text(file_path, file_type)
 
+        except Exception as e:
+            self.logger.error(f"Failed to parse resume with Gemini: {e}")
+            raise ParsingError(f"Failed to parse resume from {file_path}: {e}")
+
+        return self.parse_text(raw_text, file_path, file_type)
+
+    def parse_text(self, raw_text: str, file_path: Optional[Path] = None,
+                   file_type: FileType = FileType.TXT) -> ResumeData:
+        """Parse already-extracted resume text and return structured data.
+
+        Callers that already hold the resume text (for example from an
+        earlier parse) can use this to skip reading the file again.
+
+        Args:
+            raw_text: Resume text
+            file_path: Path of the original file, if any
+            file_type: Type of the original file
+
+        Returns:
+            ResumeData: Structured resume data
+
+        Raises:
+            ParsingError: If parsing fails
+        """
+        try:
             if not raw_text.strip():
                 raise ParsingError("No text could be extracted from the file")
 
@@ -46,78 +561,183 @@ class GeminiResumeParser(BaseResumeParser):
             gemini_data = self.parse_with_gemini(raw_text)
 
             # Convert to ResumeData object
-            resume_data = self._convert_to_resume_data(gemini_data, raw_text, file_path, file_type)
-
-            return resume_data
+            return self._convert_to_resume_data(gemini_data, raw_text, file_path, file_type)
 
         except Exception as e:
             self.logger.error(f"Failed to parse resume with Gemini: {e}")
-            raise ParsingError(f"Failed to parse resume from {file_path}: {e}")
+            raise ParsingError(f"Failed to parse resume from {file_path or 'text'}: {e}")
+
+    def parse_many(self, file_paths: List[Path]) -> List[ResumeData]:
+        """Parse several resumes, sending the uncached ones to Gemini in one call.
+
+        Text is extracted concurrently, then all resumes that are not already in
+        the parsed-resume cache are sent in a single request that returns a JSON
+        array. If the combined text is too large for one request, or the batch
+        response cannot be matched up with the inputs, each resume is parsed
+        individually instead.
+
+        Args:
+            file_paths: Paths to resume files (PDF, DOCX, or TXT)
+
+        Returns:
+            List[ResumeData]: Parsed resumes in the same order as ``file_paths``
+
+        Raises:
+            ParsingError: If any resume fails to parse
+        """
+        try:
+            file_types = [self._get_file_type(path) for path in file_paths]
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths) or 1)) as executor:
+                raw_texts = list(executor.map(self._extract_text, file_paths, file_types))
+
+            for path, raw_text in zip(file_paths, raw_texts):
+                if not raw_text.strip():
+                    raise ParsingError(f"No text could be extracted from {path}")
+
+            parsed: Dict[int, Dict[str, Any]] = {}
+            pending: List[int] = []
+            for i, raw_text in enumerate(raw_texts):
+                cached = self.cache_manager.get(self._get_cache_key(raw_text)) if self.cache_manager else None
+                if cached is not None:
+                    parsed[i] = cached
+                else:
+                    pending.append(i)
+
+            batch = self._parse_batch_with_gemini([raw_texts[i] for i in pending]) if pending else []
+            for i, gemini_data in zip(pending, batch):
+                parsed[i] = gemini_data
+                if gemini_data and self.cache_manager is not None:
+                    self.cache_manager.set(self._get_cache_key(raw_texts[i]), gemini_data)
+
+            # Anything the batch call could not cover is parsed on its own, with
+            # the requests issued concurrently (the shared rate limiter still applies)
+            leftover = pending[len(batch):]
+            if leftover:
+                with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(leftover))) as executor:
+                    results = executor.map(self.parse_with_gemini, [raw_texts[i] for i in leftover])
+                    parsed.update(zip(leftover, results))
+
+            return [
+                self._convert_to_resume_data(parsed[i], raw_texts[i], file_paths[i], file_types[i])
+                for i in range(len(file_paths))
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Failed to batch parse resumes with Gemini: {e}")
+            raise ParsingError(f"Failed to parse resumes {[str(p) for p in file_paths]}: {e}")
+
+    def _parse_batch_with_gemini(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Parse several resume texts in one Gemini call.
+
+        Returns an empty list when the batch is too large or the response is not
+        a JSON array with one object per resume, so the caller can fall back to
+        per-resume parsing.
+        """
+        if len(texts) < 2 or sum(len(t) for t in texts) > _MAX_BATCH_CHARS:
+            return []
+
+        user_prompt = "\n---\n".join(
+            f"Resume {n}:\n{text}" for n, text in enumerate(texts, 1)
+        )
+        system_prompt = (
+            f"{_SYSTEM_PROMPT} The input contains {len(texts)} resumes separated by "
+            f"'---'; return a JSON array with exactly {len(texts)} resume objects in order."
+        )
+        try:
+            response = self.gemini_client.invoke(
+                system_prompt, user_prompt,
+                response_schema=RESUME_BATCH_RESPONSE_SCHEMA
+            )
+            items = _jloads(_strip_code_fence(response))
+        except Exception as e:
+            self.logger.warning(f"Batch Gemini parse failed, parsing individually: {e}")
+            return []
+
+        if not isinstance(items, list) or len(items) != len(texts) or not all(isinstance(x, dict) for x in items):
+            self.logger.warning("Batch Gemini response did not match the inputs, parsing individually")
+            return []
+        return items
 
     def parse_with_gemini(self, text: str) -> Dict[str, Any]:
-        """Use Gemini to parse resume text.
+        """Use Gemini to parse resume text, reusing previously parsed results.
 
-        This sends a strict prompt asking Gemini to return ONLY valid JSON
-        with Title‑Case keys (Strict Capitalization). If the first response
-        is not valid JSON, a second strict conversion call is made.
+        Parsed dictionaries are cached on disk keyed by the model name and a
+        SHA-256 of the resume text, so re-parsing the same resume skips the
+        Gemini round trip and JSON handling entirely. Empty (failed) results
+        are never cached.
+        """
+        cache_key = None
+        if self.cache_manager is not None:
+            cache_key = self._get_cache_key(text)
+            cached = self.cache_manager.get(cache_key)
+            if cached is not None:
+                self.logger.info("Using cached Gemini resume parse")
+                return cached
+
+        parsed_data = self._request_gemini_json(text)
+
+        if parsed_data and cache_key:
+            self.cache_manager.set(cache_key, parsed_data)
+        return parsed_data
+
+    def _get_cache_key(self, text: str) -> str:
+        """Build the parsed-resume cache key from the model, prompts, schema and resume text."""
+        model = getattr(self.gemini_client, 'model_name', '')
+        return hashlib.sha256(f"{_GEMINI_CACHE_SALT}|||{model}|||{text}".encode('utf-8')).hexdigest()
+
+    def _request_gemini_json(self, text: str) -> Dict[str, Any]:
+        """Ask Gemini to convert resume text into Title‑Case JSON.
+
+        The expected structure is sent as a response schema (Gemini JSON mode)
+        rather than spelled out in the prompt, which keeps the system prompt
+        short. If the response still is not valid JSON, a second strict call
+        asks Gemini to repair that response.
         """
         try:
-            system_prompt = """You are an expert resume parser. Convert the provided resume TEXT into STRICT JSON only.
-- Use these exact Title‑Case keys (case sensitive): "Name","Email","Phone","LinkedIn","GitHub","Summary","Skills","Experience","Education","Certifications","Projects".
-- Use null for missing scalar fields.
-- Skills must be an array of strings.
-- Experience must be an array of objects with keys: "Company","Position","Duration","Description","StartDate","EndDate". "Description" must be an array of strings.
-- Education must be an array of objects with keys: "Institution","Degree","Field","Year","GPA","Description". "Description" must be an array of strings.
-- Return only a single valid JSON object, nothing else (no surrounding text, no markdown, no comments).
-Example:
-{
-  "Name": "Jane Doe",
-  "Email": "jane@example.com",
-  "Phone": "+1234567890",
-  "LinkedIn": "https://linkedin.com/in/janedoe",
-  "GitHub": "https://github.com/janedoe",
-  "Summary": "Experienced software engineer...",
-  "Skills": ["Python","Django","AWS"],
-  "Experience": [
-    {
-      "Company": "Example Inc",
-      "Position": "Senior Engineer",
-      "Duration": "2019 - Present",
-      "Description": ["Led backend team","Improved CI/CD"],
-      "StartDate": "2019-06",
-      "EndDate": null
-    }
-  ],
-  "Education": [
-    {
-      "Institution": "State University",
-      "Degree": "Bachelor of Science",
-      "Field": "Computer Science",
-      "Year": "2018",
-      "GPA": null,
-      "Description": []
-    }
-  ],
-  "Certifications": null,
-  "Projects": null
-}"""
-
-            user_prompt = f"Convert this resume text to the strict JSON schema above. Text:\n\n{text}"
-
-            response = self.gemini_client.invoke(system_prompt, user_prompt)
+            user_prompt = f"Resume text:\n\n{text}"
 
-            try:
-                parsed_data = json.loads(response)
+            response = self._stream_response(_SYSTEM_PROMPT, user_prompt)
+
+            parsed_data = _try_parse_json(response)
+            if parsed_data is not None:
                 return parsed_data
-            except json.JSONDecodeError:
-                self.logger.warning("Gemini first response not valid JSON — requesting strict JSON conversion again.")
-                # Ask Gemini again to strictly convert the ORIGINAL text into Title‑Case JSON
-                return self._extract_from_text_response(text)
+
+            self.logger.warning("Gemini first response not valid JSON — requesting strict JSON repair.")
+            # Send back only the malformed response, which is much shorter than the resume
+            return self._extract_from_text_response(text, response)
 
         except Exception as e:
             self.logger.error(f"Gemini parsing failed: {e}")
             return {}
     
+    def _stream_response(self, system: str, user: str) -> str:
+        """Collect a streamed Gemini response, stopping once it is complete JSON.
+
+        Chunks are accumulated as they arrive while brace depth is tracked, and
+        the stream is closed as soon as the top-level object is complete.
+        Clients without streaming support fall back to a single blocking
+        invoke().
+        """
+        invoke_stream = getattr(self.gemini_client, 'invoke_stream', None)
+        if invoke_stream is None:
+            return self.gemini_client.invoke(system, user, response_schema=RESUME_RESPONSE_SCHEMA)
+
+        chunks: List[str] = []
+        tracker = _BraceTracker()
+        stream = invoke_stream(system, user, response_schema=RESUME_RESPONSE_SCHEMA)
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                if tracker.feed(chunk):
+                    # The top-level object is closed; stop reading so the
+                    # remaining generation is not waited on.
+                    break
+        finally:
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+        return ''.join(chunks)
+
     # def parse_with_gemini(self, text: str) -> Dict[str, Any]:
     #     """Use Gemini to parse resume text.
 
@@ -168,7 +788,7 @@ Example:
         self, 
         gemini_data: Dict[str, Any], 
         raw_text: str, 
-        file_path: Path, 
+        file_path: Optional[Path], 
         file_type: FileType
     ) -> ResumeData:
         """Convert Gemini parsed dictionary to ResumeData object.
@@ -181,153 +801,12 @@ Example:
 
         Returns:
             ResumeData: Structured resume data object
-        """
-        # Helper to normalize fields that may come as JSON-strings, nested JSON, dicts or lists
-        def _normalize_possible_json_field(value):
-            # If it's a string that looks like JSON, try to parse it
-            if isinstance(value, str):
-                s = value.strip()
-                if (s.startswith('{') or s.startswith('[')):
-                    try:
-                        parsed = json.loads(s)
-                        return parsed
-                    except Exception:
-                        # fall through and return original string
-                        return value
-            return value
-
-        def _extract_text_from_possible_obj(v, keys=None):
-            """Return a clean string from v which can be str/list/dict.
-            If dict, prefer keys in `keys` (list) or join values.
-            If list, join elements.
-            """
-            v = _normalize_possible_json_field(v)
-            if v is None:
-                return ""
-            if isinstance(v, str):
-                return v.strip()
-            if isinstance(v, list):
-                return " \n".join(str(x).strip() for x in v if x)
-            if isinstance(v, dict):
-                # Prefer requested keys if provided
-                if keys:
-                    for k in keys:
-                        if k in v:
-                            return _extract_text_from_possible_obj(v[k])
-                # fallback: join values
-                return " ".join(str(x).strip() for x in v.values() if x)
-            return str(v)
-
-        def _extract_list_from_possible_obj(v):
-            """Return a list of strings from v which can be str/list/dict."""
-            v = _normalize_possible_json_field(v)
-            if v is None:
-                return []
-            if isinstance(v, list):
-                return [str(x).strip() for x in v if x is not None and str(x).strip()]
-            if isinstance(v, dict):
-                # Common case: {'skills': [...]} or {'Skills': [...]}
-                for key in ('Skills', 'skills'):
-                    if key in v and isinstance(v[key], list):
-                        return [str(x).strip() for x in v[key] if x]
-                    if key in v and isinstance(v[key], str):
-                        # parse string into list
-                        return [s.strip() for s in re.split(r'[,\n•\u2022\|;]+', v[key]) if s.strip()]
-                # fallback: use values
-                vals = []
-                for x in v.values():
-                    vals.extend(_extract_list_from_possible_obj(x))
-                return vals
-            if isinstance(v, str):
-                s = v.strip()
-                # If string looks like JSON array, try parse
-                if s.startswith('['):
-                    try:
-                        parsed = json.loads(s)
-                        return _extract_list_from_possible_obj(parsed)
-                    except Exception:
-                        pass
-                # Split by common separators
-                items = [sitem.strip() for sitem in re.split(r'[,\n•\u2022\|;]+', s) if sitem.strip()]
-                return items
-            return [str(v).strip()]
-
-        # Initialize ResumeData
-        resume_data = ResumeData(
-            raw_text=raw_text,
-            file_path=file_path,
-            file_type=file_type
-        )
-
-        # Populate contact info
-        resume_data.contact_info = ContactInfo(
-            name=_extract_text_from_possible_obj(gemini_data.get('Name', '')),
-            email=_extract_text_from_possible_obj(gemini_data.get('Email', '')),
-            phone=_extract_text_from_possible_obj(gemini_data.get('Phone', '')),
-            linkedin=_extract_text_from_possible_obj(gemini_data.get('LinkedIn', '')),
-            github=_extract_text_from_possible_obj(gemini_data.get('GitHub', ''))
-        )
 
-        # Populate summary (ensure it's a plain string)
-        resume_data.summary = _extract_text_from_possible_obj(gemini_data.get('Summary', ''))
-
-        # Populate skills (ensure it's a list of strings)
-        resume_data.skills = _extract_list_from_possible_obj(gemini_data.get('Skills', []))
-
-        # Populate experience
-        experience_data = gemini_data.get('Experience', [])
-        resume_data.experience = []
-        experience_data = _normalize_possible_json_field(experience_data)
-        if isinstance(experience_data, list):
-            for exp in experience_data:
-                if isinstance(exp, dict):
-                    desc = exp.get('Description', [])
-                    if isinstance(desc, str):
-                        desc_list = [d.strip() for d in re.split(r'[\n•\u2022]+', desc) if d.strip()]
-                    elif isinstance(desc, list):
-                        desc_list = [str(d).strip() for d in desc if d]
-                    else:
-                        desc_list = [str(desc)]
-
-                    exp_obj = Experience(
-                        company=_extract_text_from_possible_obj(exp.get('Company', '')),
-                        position=_extract_text_from_possible_obj(exp.get('Position', '')),
-                        duration=_extract_text_from_possible_obj(exp.get('Duration', '')),
-                        description=desc_list,
-                        start_date=exp.get('StartDate'),
-                        end_date=exp.get('EndDate')
-                    )
-                    resume_data.experience.append(exp_obj)
-
-        # Populate education
-        education_data = gemini_data.get('Education', [])
-        resume_data.education = []
-        education_data = _normalize_possible_json_field(education_data)
-        if isinstance(education_data, list):
-            for edu in education_data:
-                if isinstance(edu, dict):
-                    edu_obj = Education(
-                        institution=_extract_text_from_possible_obj(edu.get('Institution', '')),
-                        degree=_extract_text_from_possible_obj(edu.get('Degree', '')),
-                        field=_extract_text_from_possible_obj(edu.get('Field', '')),
-                        graduation_date=_extract_text_from_possible_obj(edu.get('Year', '')),
-                        gpa=edu.get('GPA'),
-                        description=_extract_list_from_possible_obj(edu.get('Description', []))
-                    )
-                    resume_data.education.append(edu_obj)
-
-        # Certifications
-        certifications_raw = gemini_data.get('Certifications', [])
-        # treat literal "null" as empty
-        if isinstance(certifications_raw, str) and certifications_raw.strip().lower() == 'null':
-            certifications_raw = []
-        resume_data.certifications = _extract_list_from_possible_obj(certifications_raw)
-
-        # Projects (keep as string or empty) only if model supports it
-        if hasattr(resume_data, 'projects'):
-            resume_data.projects = _extract_text_from_possible_obj(gemini_data.get('Projects', ''))
-
-        return resume_data
+        Raises:
+            pydantic.ValidationError: If gemini_data is not a JSON object
+        """
+        parsed = _GeminiResume.model_validate(gemini_data)
+        return parsed.to_resume_data(raw_text, file_path, file_type)
 
     def _get_file_type(self, file_path: Path) -> FileType:
         """Determine file type from extension.
@@ -341,15 +820,7 @@ Example:
         Raises:
             ParsingError: If file type is not supported
         """
-        suffix = file_path.suffix.lower()
-        if suffix == '.pdf':
-            return FileType.PDF
-        elif suffix == '.docx':
-            return FileType.DOCX
-        elif suffix == '.txt':
-            return FileType.TXT
-        else:
-            raise ParsingError(f"Unsupported file type: {suffix}")
+        return file_type_for(file_path)
 
     def _extract_text(self, file_path: Path, file_type: FileType) -> str:
         """Extract text based on file type.
@@ -364,14 +835,7 @@ Example:
         Raises:
             ParsingError: If extraction fails
         """
-        if file_type == FileType.PDF:
-            return self.text_extractor.extract_from_pdf(file_path)
-        elif file_type == FileType.DOCX:
-            return self.text_extractor.extract_from_docx(file_path)
-        elif file_type == FileType.TXT:
-            return self.text_extractor.extract_from_txt(file_path)
-        else:
-            raise ParsingError(f"Unsupported file type: {file_type}")
+        return self.text_extractor.extract(file_path, file_type)
 
     # def _extract_from_text_response(self, response: str) -> Dict[str, Any]:
     #     """Extract data from Gemini's text response when JSON parsing fails.
@@ -399,23 +863,28 @@ Example:
     #     return data
     
 
-    def _extract_from_text_response(self, text: str) -> Dict[str, Any]:
-        """Fallback that asks Gemini explicitly to produce strict Title‑Case JSON from the raw text."""
+    def _extract_from_text_response(self, text: str, response: str = "") -> Dict[str, Any]:
+        """Fallback that asks Gemini explicitly to produce strict Title‑Case JSON.
+
+        When the malformed first ``response`` is available only that is sent
+        back for repair; otherwise the raw resume ``text`` is converted again.
+        """
         try:
-            strict_system = """You MUST return a single VALID JSON object and NOTHING ELSE.
-Use the exact Title‑Case keys and structure described previously:
-"Name","Email","Phone","LinkedIn","GitHub","Summary","Skills","Experience","Education","Certifications","Projects".
-Ensure arrays and nulls are used correctly. Do NOT include any explanatory text."""
-            user_prompt = f"Strictly convert the following resume text into the required Title‑Case JSON schema. Respond ONLY with JSON.\n\n{text}"
+            if response.strip():
+                user_prompt = f"Fix and return strict JSON for this data: {response}"
+            else:
+                user_prompt = f"Strictly convert the following resume text into the required Title‑Case JSON schema. Respond ONLY with JSON.\n\n{text}"
 
-            response = self.gemini_client.invoke(strict_system, user_prompt)
+            response = self.gemini_client.invoke(
+                _STRICT_SYSTEM_PROMPT, user_prompt, response_schema=RESUME_RESPONSE_SCHEMA
+            )
 
-            try:
-                parsed = json.loads(response)
+            parsed = _try_parse_json(response)
+            if parsed is not None:
                 return parsed
-            except json.JSONDecodeError:
-                self.logger.error("Strict Gemini JSON conversion failed; response was not JSON.")
-                return {}
+
+            self.logger.error("Strict Gemini JSON conversion failed; response was not JSON.")
+            return {}
 
         except Exception as e:
             self.logger.error(f"Strict JSON extraction via Gemini failed: {e}")
@@ -1,8 +1,6 @@
-from .GeminiParser import GeminiResumeParser
-from .parser import BaseResumeParser
-from .parser import SpacyResumeParser
-
 from typing import Optional
+
+from .parser import BaseResumeParser
 from ..ai_integration.gemini_client import GeminiClient
 
 class ResumeParserFactory:
@@ -10,11 +8,15 @@ class ResumeParserFactory:
 
     @staticmethod
     def create_parser(parser_type: str = "gemini", gemini_client: Optional[GeminiClient] = None) -> BaseResumeParser:
-        """Create a resume parser instance."""
+        """Create a resume parser instance.
+
+        Parser modules are imported only when their parser is requested.
+        """
         if parser_type == "spacy":
-            return SpacyResumeParser(gemini_client=gemini_client)
+            from .parser import SpacyResumeParser
+            return SpacyResumeParser()
         elif parser_type == "gemini":
             from .GeminiParser import GeminiResumeParser
             return GeminiResumeParser(gemini_client=gemini_client)
         else:
-            raise ValueError(f"Unknown parser type: {parser_type}")
\ No newline at end of file
+            raise ValueError(f"Unknown parser type: {parser_type}")
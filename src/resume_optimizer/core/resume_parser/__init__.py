@@ -1,7 +1,18 @@
 """Package initialization."""
 
 from .ResumeParserFactory import ResumeParserFactory
-from .GeminiParser import GeminiResumeParser
-from .parser import SpacyResumeParser, BaseResumeParser
+from .parser import BaseResumeParser
 
 __all__ = ['ResumeParserFactory', 'GeminiResumeParser', 'SpacyResumeParser', 'BaseResumeParser']
+
+
+def __getattr__(name):
+    # Parser implementations are imported on first access so that importing
+    # the package only pays for the parser actually used.
+    if name == 'GeminiResumeParser':
+        from .GeminiParser import GeminiResumeParser
+        return GeminiResumeParser
+    if name == 'SpacyResumeParser':
+        from .parser import SpacyResumeParser
+        return SpacyResumeParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
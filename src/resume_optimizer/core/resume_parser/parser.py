@@ -3,17 +3,31 @@ Resume parser module using spaCy and other NLP libraries with gm fallback.
 Implements Strategy pattern for different parsing approaches.
 """
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-import spacy
-from pypdf import PdfReader
-import docx
+from typing import List, Dict, Optional, Any, Tuple
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 import re
 from datetime import datetime
 
 from ...utils.exceptions import ParsingError, FileProcessingError
+from ...utils.nlp import load_spacy_model
+from ...utils.rate_limiter import CacheManager
 from ..models import ResumeData, ContactInfo, FileType, Experience, Education
 
 
@@ -26,20 +40,97 @@ class BaseResumeParser(ABC):
         pass
 
 
+# PDFs with at least this many pages are extracted across worker processes
+_PARALLEL_PDF_MIN_PAGES = 8
+# Worker processes used to extract one large PDF
+_PDF_WORKERS = min(os.cpu_count() or 1, 8)
+
+# pypdf text options: plain (non-layout) extraction; word order is all the
+# parsers need. Rotated text (e.g. vertical sidebar labels) is kept.
+_PDF_TEXT_OPTIONS = {'extraction_mode': 'plain'}
+# Guards every pypdfium2 call; the library must not be used from two threads
+_PDFIUM_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _pdf_process_pool() -> ProcessPoolExecutor:
+    """Long-lived pool for extracting large PDFs, created on first use.
+
+    Workers are spawned rather than forked: the Streamlit server is
+    multi-threaded, and forking a threaded process can deadlock the child.
+    """
+    return ProcessPoolExecutor(max_workers=_PDF_WORKERS, mp_context=get_context("spawn"))
+
+
+def _extract_pdf_pages(path_str: str, start: int, stop: int) -> List[str]:
+    """Extract text from pages [start, stop) of a PDF in a worker process."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path_str)
+    return [reader.pages[i].extract_text(**_PDF_TEXT_OPTIONS) for i in range(start, stop)]
+
+
 class TextExtractor:
     """Handles text extraction from different file formats."""
 
+    @staticmethod
+    def extract(file_path: Path, file_type: FileType) -> str:
+        """Extract text, reusing the result for an unchanged file.
+
+        The cache key is the file's path, size, mtime and a hash of its first
+        64 KiB, so re-parsing the same upload skips the extraction pass.
+        """
+        try:
+            stat = file_path.stat()
+            with open(file_path, 'rb') as f:
+                head_digest = hashlib.sha1(f.read(_HEAD_HASH_BYTES)).hexdigest()
+        except OSError as e:
+            raise FileProcessingError(f"Failed to read {file_path}: {e}")
+        return _extract_cached(
+            str(file_path), file_type, stat.st_size, stat.st_mtime_ns, head_digest
+        )
+
     @staticmethod
     def extract_from_pdf(file_path: Path) -> str:
-        """Extract text from PDF file."""
+        """Extract text from PDF file.
+
+        Uses pypdfium2 (PDFium bindings) when installed, which is much faster
+        than pypdf on multi-page documents; otherwise falls back to pypdf.
+        """
         try:
+            if pdfium is not None:
+                # PDFium is not thread-safe, and batch parsing extracts files
+                # on a thread pool, so all PDFium calls are serialized
+                with _PDFIUM_LOCK:
+                    pdf = pdfium.PdfDocument(str(file_path))
+                    try:
+                        pages = []
+                        for page in pdf:
+                            textpage = page.get_textpage()
+                            pages.append(textpage.get_text_range())
+                            textpage.close()
+                            page.close()
+                    finally:
+                        pdf.close()
+                return "\n".join(pages).strip()
+
+            from pypdf import PdfReader
+
             reader = PdfReader(str(file_path))
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            return text.strip()
+            page_count = len(reader.pages)
+            if page_count < _PARALLEL_PDF_MIN_PAGES:
+                texts = [page.extract_text(**_PDF_TEXT_OPTIONS) for page in reader.pages]
+            else:
+                # pypdf is pure Python and its reader is not thread-safe, so long
+                # documents are split into page ranges across the shared worker
+                # pool, one range per worker; each worker reopens the file.
+                step = -(-page_count // _PDF_WORKERS)
+                ranges = [(i, min(i + step, page_count)) for i in range(0, page_count, step)]
+                chunks = _pdf_process_pool().map(
+                    _extract_pdf_pages, [str(file_path)] * len(ranges), *zip(*ranges)
+                )
+                texts = [text for chunk in chunks for text in chunk]
+            return "\n".join(t for t in texts if t).strip()
         except Exception as e:
             raise FileProcessingError(f"Failed to extract text from PDF: {e}")
 
@@ -47,20 +138,24 @@ class TextExtractor:
     def extract_from_docx(file_path: Path) -> str:
         """Extract text from DOCX file."""
         try:
+            import docx
+
             doc = docx.Document(str(file_path))
-            text = ""
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-            
+            # paragraph.text and cell.text are rebuilt from runs on every
+            # access, so each is read once; isspace() tests for blank text
+            # without building a stripped copy
+            lines = [text for text in (p.text for p in doc.paragraphs) if text and not text.isspace()]
+
             # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text += cell.text + "\n"
-            
-            return text.strip()
+            lines.extend(
+                text
+                for table in doc.tables
+                for row in table.rows
+                for text in (cell.text for cell in row.cells)
+                if text and not text.isspace()
+            )
+
+            return "\n".join(lines).strip()
         except Exception as e:
             raise FileProcessingError(f"Failed to extract text from DOCX: {e}")
 
@@ -76,47 +171,137 @@ class TextExtractor:
                 raise FileProcessingError(f"Failed to extract text from TXT: {e}")
 
 
+# Bytes hashed from the start of a file when keying the extraction cache
+_HEAD_HASH_BYTES = 64 * 1024
+
+
+_EXT_TO_FILETYPE = {'.pdf': FileType.PDF, '.docx': FileType.DOCX, '.txt': FileType.TXT}
+
+_EXTRACTORS = {
+    FileType.PDF: TextExtractor.extract_from_pdf,
+    FileType.DOCX: TextExtractor.extract_from_docx,
+    FileType.TXT: TextExtractor.extract_from_txt,
+}
+
+
+@lru_cache(maxsize=64)
+def _extract_cached(path_str: str, file_type: FileType, size: int, mtime_ns: int,
+                    head_digest: str) -> str:
+    """Extract text for one file version; size/mtime/digest only key the cache."""
+    extractor = _EXTRACTORS.get(file_type)
+    if extractor is None:
+        raise ParsingError(f"Unsupported file type: {file_type}")
+    return extractor(Path(path_str))
+
+
+def file_type_for(file_path: Path) -> FileType:
+    """Map a resume file's extension to its FileType.
+
+    Raises:
+        ParsingError: If the extension is not supported
+    """
+    suffix = file_path.suffix.lower()
+    try:
+        return _EXT_TO_FILETYPE[suffix]
+    except KeyError:
+        raise ParsingError(f"Unsupported file type: {suffix}")
+
+
+# Contact patterns, compiled once at import and shared by every extractor
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_US = r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'
+_PHONE_INDIA = r'\b(?:\+?91[-.\s]?)?[6-9][0-9]{9}\b'
+_PHONE_INTL = r'\b(?:\+?[1-9][0-9]{0,3}[-.\s]?)?[0-9]{4,14}\b'
+# The three formats fused into one pattern matched at the start of the text.
+# Each alternative is a lookahead that finds the first occurrence of its
+# format anywhere, so US numbers still take precedence over Indian ones and
+# both over the general international format.
+_PHONE_RE = re.compile(
+    rf'(?=[\s\S]*?(?P<phone>{_PHONE_US}))'
+    rf'|(?=[\s\S]*?(?P<phone_india>{_PHONE_INDIA}))'
+    rf'|(?=[\s\S]*?(?P<phone_intl>{_PHONE_INTL}))'
+)
+_NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
+# Characters of resume text passed to spaCy NER (the name is in the header)
+_NER_PREFIX_CHARS = 1500
+# A first line that is just two to four capitalised words, e.g. "Jane Doe"
+_NAME_LINE_RE = re.compile(r'[A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+){1,3}')
+# Capitalised words that make such a line a section heading or job title
+_NON_NAME_WORDS = frozenset((
+    'resume', 'curriculum', 'vitae', 'summary', 'profile', 'objective', 'contact',
+    'about', 'overview', 'career', 'experience', 'employment', 'history',
+    'education', 'academic', 'background', 'qualifications', 'skills',
+    'competencies', 'technologies', 'projects', 'portfolio', 'certifications',
+    'certificates', 'credentials', 'licenses', 'work', 'professional',
+    'technical', 'personal', 'software', 'data', 'engineer', 'developer',
+    'manager', 'analyst', 'scientist', 'consultant', 'director', 'designer',
+    'architect', 'specialist', 'intern', 'senior', 'junior', 'lead', 'principal',
+    'full', 'stack', 'machine', 'learning',
+))
+_LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[A-Za-z0-9-]+/?', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9-]+/?', re.IGNORECASE)
+
+
 class ContactInfoExtractor:
     """Extracts contact information from resume text."""
 
     def __init__(self):
-        # Enhanced patterns for better matching
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_patterns = [
-            re.compile(r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'),  # US
-            re.compile(r'\b(?:\+?91[-.\s]?)?[6-9][0-9]{9}\b'),  # India
-            re.compile(r'\b(?:\+?[1-9][0-9]{0,3}[-.\s]?)?[0-9]{4,14}\b')  # General international
-        ]
-        self.linkedin_pattern = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[A-Za-z0-9-]+/?', re.IGNORECASE)
-        self.github_pattern = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9-]+/?', re.IGNORECASE)
-
-    def extract(self, text: str, nlp_doc) -> ContactInfo:
-        """Extract contact information from text."""
+        self.email_pattern = _EMAIL_RE
+        self.phone_pattern = _PHONE_RE
+        self.linkedin_pattern = _LINKEDIN_RE
+        self.github_pattern = _GITHUB_RE
+
+    def extract(self, text: str, nlp_doc, text_lower: Optional[str] = None) -> ContactInfo:
+        """Extract contact information from text.
+
+        The name comes from the resume header when it is a plain name line,
+        otherwise from spaCy PERSON entities in ``nlp_doc`` (if given).
+        ``text_lower`` may pass in an already lowercased copy of ``text``.
+        """
+        return self.extract_with_header_name(
+            text, self.extract_name_heuristic(text), nlp_doc, text_lower
+        )
+
+    def extract_with_header_name(self, text: str, header_name: Optional[str], nlp_doc,
+                                 text_lower: Optional[str] = None) -> ContactInfo:
+        """Extract contact information given ``extract_name_heuristic(text)``.
+
+        Lets batch callers that already ran the header check to decide which
+        resumes need NER reuse its result instead of repeating it.
+        """
         contact = ContactInfo()
+        # Cheap substring checks skip a pattern's full-text scan when it cannot
+        # match; none of these patterns has a literal prefix to anchor on
+        if text_lower is None:
+            text_lower = text.lower()
 
         # Extract email
-        email_matches = self.email_pattern.findall(text)
-        if email_matches:
-            contact.email = email_matches[0]  # Take first valid email
-
-        # Extract phone with multiple patterns
-        for pattern in self.phone_patterns:
-            phone_match = pattern.search(text)
-            if phone_match:
-                phone = re.sub(r'[^\d+]', '', phone_match.group())
-                if len(phone) >= 10:  # Valid phone should have at least 10 digits
-                    contact.phone = phone_match.group()
-                    break
+        email_match = self.email_pattern.search(text) if '@' in text else None
+        if email_match:
+            contact.email = email_match.group()  # Take first valid email
+
+        # Extract phone, trying the US, Indian and international formats in order
+        phone_match = self.phone_pattern.match(text)
+        if phone_match:
+            candidate = phone_match.group(phone_match.lastgroup)
+            # US and Indian matches always have 10 digits; the general
+            # international format can match shorter numbers
+            if phone_match.lastgroup != 'phone_intl' or len(_NON_PHONE_CHARS_RE.sub('', candidate)) >= 10:
+                contact.phone = candidate
 
         # Extract LinkedIn
-        linkedin_matches = self.linkedin_pattern.findall(text)
-        if linkedin_matches:
-            contact.linkedin = linkedin_matches[0]
+        linkedin_match = self.linkedin_pattern.search(text) if 'linkedin.com' in text_lower else None
+        if linkedin_match:
+            contact.linkedin = linkedin_match.group()
 
         # Extract GitHub
-        github_matches = self.github_pattern.findall(text)
-        if github_matches:
-            contact.github = github_matches[0]
+        github_match = self.github_pattern.search(text) if 'github.com' in text_lower else None
+        if github_match:
+            contact.github = github_match.group()
+
+        contact.name = header_name
+        if contact.name or nlp_doc is None:
+            return contact
 
         # Extract name using NER with better logic
         person_entities = [ent for ent in nlp_doc.ents if ent.label_ == "PERSON"]
@@ -132,64 +317,161 @@ class ContactInfoExtractor:
 
         return contact
 
+    @staticmethod
+    def extract_name_heuristic(text: str) -> Optional[str]:
+        """Return the resume's first non-empty line if it is a plain name line.
+
+        Only the first line is trusted: a later Title-Case line is as likely a
+        job title, location or heading, so any other header is left to NER.
+        """
+        for line in text[:_NER_PREFIX_CHARS].split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if _NAME_LINE_RE.fullmatch(line) and not any(
+                word.lower() in _NON_NAME_WORDS for word in line.split()
+            ):
+                return line
+            return None
+        return None
+
+
+# Focused technical skills database
+_TECH_SKILLS = frozenset({
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'php', 'ruby', 'swift',
+    'kotlin', 'scala', 'go', 'rust', 'r', 'matlab', 'shell', 'bash',
+
+    # Web Technologies
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
+    'fastapi', 'spring', 'laravel', 'jquery', 'bootstrap', 'next.js',
+
+    # Databases
+    'mongodb', 'mysql', 'postgresql', 'sqlite', 'redis', 'elasticsearch', 'oracle',
+
+    # Cloud & DevOps
+    'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'jenkins', 'git',
+
+    # Data Science & ML
+    'machine learning', 'deep learning', 'data science', 'artificial intelligence',
+    'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'jupyter', 'spark',
+
+    # Testing & Methodologies
+    'selenium', 'jest', 'pytest', 'agile', 'scrum', 'devops', 'ci/cd', 'rest api'
+})
+
+# Skill variations and aliases
+_SKILL_ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'k8s': 'kubernetes'
+}
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+@lru_cache(maxsize=1)
+def _skill_scanner() -> Tuple["re.Pattern[str]", Dict[str, str], Dict[str, Tuple[str, ...]]]:
+    """Build the single-pass skill matcher shared by every SkillsExtractor.
+
+    Returns:
+        - A regex that finds every skill or alias with word boundaries at
+          each start position (zero-width lookahead, longest term first)
+        - Term -> display name (aliases map to their canonical skill)
+        - Term -> shorter terms that also match wherever it matches, since
+          only one alternative can be reported per start position
+    """
+    terms = {skill: skill.title() for skill in _TECH_SKILLS}
+    terms.update(
+        (alias, full_skill.title())
+        for alias, full_skill in _SKILL_ALIASES.items()
+        if full_skill in _TECH_SKILLS
+    )
+    ordered = sorted(terms, key=len, reverse=True)
+    pattern = re.compile(r'(?=\b(' + '|'.join(map(re.escape, ordered)) + r')\b)')
+    # A prefix u of t matches wherever t does iff there is a word boundary
+    # after u inside t, e.g. 'c' within 'c++'.
+    prefixes = {
+        t: tuple(
+            u for u in terms
+            if u != t and t.startswith(u) and _is_word_char(u[-1]) != _is_word_char(t[len(u)])
+        )
+        for t in terms
+    }
+    return pattern, terms, prefixes
+
+
+@lru_cache(maxsize=1)
+def _skill_automaton():
+    """Aho-Corasick automaton over every skill and alias, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in _skill_scanner()[1]:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
 
 class SkillsExtractor:
     """Extracts skills from resume text with enhanced skill detection."""
 
     def __init__(self):
-        # Focused technical skills database
-        self.tech_skills = {
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'php', 'ruby', 'swift',
-            'kotlin', 'scala', 'go', 'rust', 'r', 'matlab', 'shell', 'bash',
-            
-            # Web Technologies
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-            'fastapi', 'spring', 'laravel', 'jquery', 'bootstrap', 'next.js',
-            
-            # Databases
-            'mongodb', 'mysql', 'postgresql', 'sqlite', 'redis', 'elasticsearch', 'oracle',
-            
-            # Cloud & DevOps
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'jenkins', 'git',
-            
-            # Data Science & ML
-            'machine learning', 'deep learning', 'data science', 'artificial intelligence',
-            'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'jupyter', 'spark',
-            
-            # Testing & Methodologies
-            'selenium', 'jest', 'pytest', 'agile', 'scrum', 'devops', 'ci/cd', 'rest api'
-        }
-        
-        # Skill variations and aliases
-        self.skill_aliases = {
-            'js': 'javascript',
-            'ts': 'typescript',
-            'py': 'python',
-            'ml': 'machine learning',
-            'ai': 'artificial intelligence',
-            'k8s': 'kubernetes'
-        }
+        self.tech_skills = _TECH_SKILLS
+        self.skill_aliases = _SKILL_ALIASES
+        self._skill_pattern, self._skill_names, self._skill_prefixes = _skill_scanner()
+        self._skill_automaton = _skill_automaton()
+
+    def extract(self, text: str, nlp_doc, text_lower: Optional[str] = None) -> List[str]:
+        """Extract skills from text with enhanced detection.
+
+        ``text_lower`` may pass in an already lowercased copy of ``text``.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        if self._skill_automaton is not None:
+            return sorted({self._skill_names[term] for term in self._scan_automaton(text_lower)})
 
-    def extract(self, text: str, nlp_doc) -> List[str]:
-        """Extract skills from text with enhanced detection."""
-        text_lower = text.lower()
         found_skills = set()
 
-        # Find technical skills
-        for skill in self.tech_skills:
-            # Use word boundaries for better matching
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill.title())
+        # One scan over the text finds every skill and alias
+        for term in set(self._skill_pattern.findall(text_lower)):
+            found_skills.add(self._skill_names[term])
+            for prefix in self._skill_prefixes[term]:
+                found_skills.add(self._skill_names[prefix])
+
+        return sorted(found_skills)
+
+    def _scan_automaton(self, text_lower: str):
+        """Yield terms found by the Aho-Corasick automaton at word boundaries."""
+        last = len(text_lower) - 1
+        for end, term in self._skill_automaton.iter(text_lower):
+            start = end - len(term) + 1
+            before = start > 0 and _is_word_char(text_lower[start - 1])
+            after = end < last and _is_word_char(text_lower[end + 1])
+            # Same rule as regex \b on both sides of the term
+            if before != _is_word_char(term[0]) and after != _is_word_char(term[-1]):
+                yield term
+
+
+def _fuse_patterns(patterns: List["re.Pattern[str]"]) -> "re.Pattern[str]":
+    """Combine compiled patterns into one that matches wherever any of them does.
 
-        # Check skill aliases
-        for alias, full_skill in self.skill_aliases.items():
-            pattern = r'\b' + re.escape(alias.lower()) + r'\b'
-            if re.search(pattern, text_lower) and full_skill in self.tech_skills:
-                found_skills.add(full_skill.title())
+    Each pattern keeps its own case sensitivity through a scoped inline flag.
+    """
+    return re.compile('|'.join(
+        f'(?i:{p.pattern})' if p.flags & re.IGNORECASE else f'(?:{p.pattern})'
+        for p in patterns
+    ))
 
-        return sorted(list(found_skills))
+
+# Keywords of a short line that ends the current experience entry
+_ENTRY_END_KEYWORDS = ('experience', 'education', 'skills')
 
 
 class ExperienceExtractor:
@@ -197,14 +479,18 @@ class ExperienceExtractor:
     
     def __init__(self):
         self.company_patterns = [
-            r'(?:at|@)\s+([A-Z][A-Za-z\s&\.\,]+(?:Inc|LLC|Corp|Company|Ltd)?)',
-            r'([A-Z][A-Za-z\s&\.\,]+(?:Inc|LLC|Corp|Company|Ltd))',
+            re.compile(r'(?:at|@)\s+([A-Z][A-Za-z\s&\.\,]+(?:Inc|LLC|Corp|Company|Ltd)?)'),
+            re.compile(r'([A-Z][A-Za-z\s&\.\,]+(?:Inc|LLC|Corp|Company|Ltd))'),
         ]
         self.position_patterns = [
-            r'((?:Senior|Junior|Lead|Principal)?\s*(?:Software Engineer|Developer|Analyst|Manager|Director|Consultant))',
-            r'((?:Data Scientist|Machine Learning Engineer|Backend Developer|Frontend Developer|Full Stack Developer))'
+            re.compile(r'((?:Senior|Junior|Lead|Principal)?\s*(?:Software Engineer|Developer|Analyst|Manager|Director|Consultant))', re.IGNORECASE),
+            re.compile(r'((?:Data Scientist|Machine Learning Engineer|Backend Developer|Frontend Developer|Full Stack Developer))', re.IGNORECASE),
         ]
         self.duration_pattern = re.compile(r'(\d{4})\s*[-–—]\s*(\d{4}|Present|Current)', re.IGNORECASE)
+        # Any company, position or duration marker starts a new entry
+        self._entry_pattern = _fuse_patterns(
+            self.company_patterns + self.position_patterns + [self.duration_pattern]
+        )
 
     def extract_from_section(self, section_text: str) -> List[Experience]:
         """Extract experience entries from experience section text."""
@@ -216,30 +502,33 @@ class ExperienceExtractor:
         # Split by lines and process
         lines = [line.strip() for line in section_text.split('\n') if line.strip()]
         current_exp = None
+        current_desc: List[str] = []
         
         for line in lines:
-            # Check for company/position patterns
-            company_match = self._extract_company(line)
-            position_match = self._extract_position(line)
-            duration_match = self.duration_pattern.search(line)
-            
-            # If we find indicators of a new job entry
-            if company_match or position_match or duration_match:
+            # One search decides whether this line starts a new job entry; the
+            # individual fields are only extracted for lines that do
+            if self._entry_pattern.search(line):
+                company_match = self._extract_company(line)
+                position_match = self._extract_position(line)
+                duration_match = self.duration_pattern.search(line)
+
                 if current_exp:
+                    current_exp.description = tuple(current_desc)
                     experiences.append(current_exp)
                 
                 current_exp = Experience(
                     company=company_match or "",
                     position=position_match or "",
-                    duration=duration_match.group() if duration_match else "",
-                    description=[]
+                    duration=duration_match.group() if duration_match else ""
                 )
+                current_desc = []
             elif current_exp and line and not self._is_section_header(line):
                 # Add as description bullet point
-                current_exp.description.append(line)
+                current_desc.append(line)
         
         # Don't forget the last experience
         if current_exp:
+            current_exp.description = tuple(current_desc)
             experiences.append(current_exp)
         
         return experiences
@@ -247,7 +536,7 @@ class ExperienceExtractor:
     def _extract_company(self, text: str) -> Optional[str]:
         """Extract company name from text."""
         for pattern in self.company_patterns:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
@@ -255,14 +544,17 @@ class ExperienceExtractor:
     def _extract_position(self, text: str) -> Optional[str]:
         """Extract position title from text."""
         for pattern in self.position_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
     
     def _is_section_header(self, line: str) -> bool:
         """Check if line looks like a section header."""
-        return len(line) < 50 and any(keyword in line.lower() for keyword in ['experience', 'education', 'skills'])
+        if len(line) >= 50:
+            return False
+        line_lower = line.lower()
+        return any(keyword in line_lower for keyword in _ENTRY_END_KEYWORDS)
 
 
 class EducationExtractor:
@@ -270,14 +562,18 @@ class EducationExtractor:
     
     def __init__(self):
         self.degree_patterns = [
-            r'(Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|M\.?A\.?|B\.?A\.?)',
-            r'(B\.?Tech|M\.?Tech|MBA|BBA)'
+            re.compile(r'(Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|M\.?A\.?|B\.?A\.?)', re.IGNORECASE),
+            re.compile(r'(B\.?Tech|M\.?Tech|MBA|BBA)', re.IGNORECASE),
         ]
         self.institution_patterns = [
-            r'(?:University|College|Institute|School)\s+of\s+([A-Za-z\s]+)',
-            r'([A-Za-z\s]+(?:University|College|Institute|School))'
+            re.compile(r'(?:University|College|Institute|School)\s+of\s+([A-Za-z\s]+)', re.IGNORECASE),
+            re.compile(r'([A-Za-z\s]+(?:University|College|Institute|School))', re.IGNORECASE),
         ]
         self.year_pattern = re.compile(r'(\d{4})')
+        # Any degree, institution or year marker starts a new entry
+        self._entry_pattern = _fuse_patterns(
+            self.degree_patterns + self.institution_patterns + [self.year_pattern]
+        )
 
     def extract_from_section(self, section_text: str) -> List[Education]:
         """Extract education entries from education section text."""
@@ -290,11 +586,11 @@ class EducationExtractor:
         current_edu = None
         
         for line in lines:
-            degree_match = self._extract_degree(line)
-            institution_match = self._extract_institution(line)
-            year_match = self.year_pattern.search(line)
-            
-            if degree_match or institution_match or year_match:
+            if self._entry_pattern.search(line):
+                degree_match = self._extract_degree(line)
+                institution_match = self._extract_institution(line)
+                year_match = self.year_pattern.search(line)
+
                 if current_edu:
                     educations.append(current_edu)
                 
@@ -315,7 +611,7 @@ class EducationExtractor:
     def _extract_degree(self, text: str) -> Optional[str]:
         """Extract degree from text."""
         for pattern in self.degree_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
@@ -323,7 +619,7 @@ class EducationExtractor:
     def _extract_institution(self, text: str) -> Optional[str]:
         """Extract institution name from text."""
         for pattern in self.institution_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
@@ -355,34 +651,37 @@ class SectionExtractor:
                 r'projects?', r'personal.*projects?', r'key.*projects?', r'portfolio'
             ]
         }
+        # One pattern matched at the start of each line. Sections are tried in
+        # order, each as a lookahead over the whole line, so the first section
+        # with any keyword on the line wins; its empty named group tells which.
+        section_alternatives = '|'.join(
+            f"(?=.*?(?:{'|'.join(patterns)}))(?P<{section}>)"
+            for section, patterns in self.section_patterns.items()
+        )
+        self._section_header_pattern = re.compile(section_alternatives, re.IGNORECASE)
+        # The same test applied to every line of a document in one finditer
+        # pass: a non-blank line of at most 50 characters once stripped, which
+        # must contain some keyword before the ordered section checks run.
+        any_keyword = '|'.join(p for patterns in self.section_patterns.values() for p in patterns)
+        self._section_header_lines = re.compile(
+            r'^[^\S\n]*(?=\S)(?![^\n]{50}[^\n]*?\S)'
+            r'(?=.*?(?:' + any_keyword + r'))(?:' + section_alternatives + r')[^\n]*',
+            re.IGNORECASE | re.MULTILINE
+        )
     
     def extract_sections(self, text: str) -> Dict[str, str]:
-        """Extract sections from resume text."""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        """Extract sections from resume text.
+
+        Header lines are found in a single regex pass over the whole text;
+        each section's body is the non-blank lines up to the next header.
+        """
         sections = {}
-        current_section = None
-        current_content = []
-        
-        for line in lines:
-            line_lower = line.lower()
-            
-            # Check if this line is a section header
-            detected_section = self._detect_section_header(line_lower)
-            
-            if detected_section:
-                # Save previous section if exists
-                if current_section and current_content:
-                    sections[current_section] = '\n'.join(current_content).strip()
-                
-                current_section = detected_section
-                current_content = []
-            elif current_section and line.strip():
-                # Add content to current section
-                current_content.append(line)
-        
-        # Don't forget the last section
-        if current_section and current_content:
-            sections[current_section] = '\n'.join(current_content).strip()
+        headers = list(self._section_header_lines.finditer(text))
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            body = text[header.end():next_header.start() if next_header else len(text)]
+            content = [line.strip() for line in body.split('\n') if line.strip()]
+            if content:
+                sections[header.lastgroup] = '\n'.join(content)
         
         return sections
     
@@ -391,92 +690,212 @@ class SectionExtractor:
         # Skip very long lines (likely not headers)
         if len(line) > 50:
             return None
-            
-        for section, patterns in self.section_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    return section
-        
-        return None
+
+        match = self._section_header_pattern.match(line)
+        return match.lastgroup if match else None
+
+
+@lru_cache(maxsize=1)
+def _shared_extractors() -> Tuple[ContactInfoExtractor, SkillsExtractor, SectionExtractor,
+                                  ExperienceExtractor, EducationExtractor]:
+    """Build the field extractors once; they hold no per-resume state."""
+    return (ContactInfoExtractor(), SkillsExtractor(), SectionExtractor(),
+            ExperienceExtractor(), EducationExtractor())
+
+
+# Part of the on-disk parsed-resume cache key; bump when extraction changes
+_PARSED_CACHE_VERSION = 1
 
 
 class SpacyResumeParser(BaseResumeParser):
     """Enhanced resume parser using spaCy NLP library"""
 
-    def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            raise ParsingError("spaCy English model not found. Run: python -m spacy download en_core_web_sm")
+    # Parsed results keyed by a hash of the file's bytes, shared by all parser
+    # instances and bounded to the most recently used entries.
+    _MAX_CACHED_RESUMES = 1024
+    _parsed_cache: "OrderedDict[str, ResumeData]" = OrderedDict()
+    _parsed_cache_lock = threading.Lock()
+
+    def __init__(self, enable_cache: bool = False, cache_ttl_hours: int = 24):
+        """
+        Initialize the spaCy resume parser.
 
+        Args:
+            enable_cache: Also cache parsed resumes on disk across runs (default: False)
+            cache_ttl_hours: On-disk cache time-to-live in hours (default: 24)
+        """
         self.text_extractor = TextExtractor()
-        self.contact_extractor = ContactInfoExtractor()
-        self.skills_extractor = SkillsExtractor()
-        self.section_extractor = SectionExtractor()
-        self.experience_extractor = ExperienceExtractor()
-        self.education_extractor = EducationExtractor()
+        (self.contact_extractor, self.skills_extractor, self.section_extractor,
+         self.experience_extractor, self.education_extractor) = _shared_extractors()
         self.logger = logging.getLogger(__name__)
+        self.cache_manager = (
+            CacheManager(cache_dir=Path.cwd() / ".cache" / "spacy_resume", ttl_hours=cache_ttl_hours)
+            if enable_cache else None
+        )
+
+    @cached_property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use and shared across parsers."""
+        return load_spacy_model()
 
     def parse(self, file_path: Path) -> ResumeData:
         """Parse resume from file and return structured data."""
-        try:
-            # Determine file type
-            file_type = self._get_file_type(file_path)
-
-            # Extract text
-            raw_text = self._extract_text(file_path, file_type)
-            
-            if not raw_text.strip():
-                raise ParsingError("No text could be extracted from the file")
+        return self.parse_many([file_path])[0]
 
-            # Process with spaCy
-            doc = self.nlp(raw_text)
+    def parse_many(self, file_paths: List[Path]) -> List[ResumeData]:
+        """Parse several resumes, running spaCy over them as one batch.
 
-            # Extract structured information
-            resume_data = ResumeData(
-                raw_text=raw_text,
-                file_path=file_path,
-                file_type=file_type
-            )
+        Text is extracted for every file first, then the documents that still
+        need NER for the candidate's name go through ``nlp.pipe`` together
+        instead of one ``nlp()`` call per file.
 
-            # Extract contact information
-            resume_data.contact_info = self.contact_extractor.extract(raw_text, doc)
+        Args:
+            file_paths: Paths to resume files (PDF, DOCX, or TXT)
 
-            # Extract skills
-            resume_data.skills = self.skills_extractor.extract(raw_text, doc)
+        Returns:
+            List[ResumeData]: Parsed resumes in the same order as ``file_paths``
 
-            # Extract sections
-            sections = self.section_extractor.extract_sections(raw_text)
-            
-            # Extract structured experience and education
-            experience_section = sections.get('experience', '')
-            education_section = sections.get('education', '')
-            
-            # Parse experience into Experience objects
-            resume_data.experience = self.experience_extractor.extract_from_section(experience_section)
-            
-            # Parse education into Education objects
-            resume_data.education = self.education_extractor.extract_from_section(education_section)
-            
-            # Safely populate other resume data with extracted sections
-            if hasattr(resume_data, 'summary'):
-                resume_data.summary = sections.get('summary', '')
-            if hasattr(resume_data, 'certifications'):
-                resume_data.certifications = sections.get('certifications', '')
-            if hasattr(resume_data, 'projects'):
-                resume_data.projects = sections.get('projects', '')
-
-            # Check if parsing was successful (has meaningful data)
-            if self._is_parsing_successful(resume_data):
-                return resume_data
-            else:
-                self.logger.info("SpaCy parsing yielded insufficient data, afallback.")
-                raise ParsingError("Insufficient data extracted with spaCy.")
+        Raises:
+            ParsingError: If any resume fails to parse
+        """
+        file_path = None
+        try:
+            results: List[Optional[ResumeData]] = []
+            inputs = []
+            for file_path in file_paths:
+                # Determine file type
+                file_type = self._get_file_type(file_path)
+
+                # Reuse the parse of an identical file seen before
+                content_hash = self._content_hash(file_path)
+                cached = self._get_cached(content_hash, file_path)
+                if cached is not None:
+                    results.append(cached)
+                    continue
+
+                # Extract text
+                raw_text = self._extract_text(file_path, file_type)
+
+                if not raw_text.strip():
+                    raise ParsingError("No text could be extracted from the file")
+                inputs.append((len(results), content_hash, file_path, file_type, raw_text))
+                results.append(None)
+
+            # Process with spaCy. NER output is only used to find the candidate's
+            # name, which sits in the resume header, so only a prefix is tagged,
+            # and only for resumes whose header has no plain name line. spaCy is
+            # never loaded when no resume needs it.
+            header_names = [
+                self.contact_extractor.extract_name_heuristic(raw_text)
+                for *_, raw_text in inputs
+            ]
+            needs_ner = [name is None for name in header_names]
+            ner_docs = iter(self.nlp.pipe(
+                (raw_text[:_NER_PREFIX_CHARS]
+                 for (*_, raw_text), ner in zip(inputs, needs_ner) if ner),
+                batch_size=32
+            ) if any(needs_ner) else ())
+
+            for (index, content_hash, file_path, file_type, raw_text), header_name in zip(inputs, header_names):
+                doc = next(ner_docs) if header_name is None else None
+                resume_data = self._build_resume_data(raw_text, header_name, doc, file_path, file_type)
+                self._store_cached(content_hash, resume_data)
+                results[index] = resume_data
+            return results
 
         except Exception as e:
             self.logger.error(f"Failed to parse resume: {e}")
             raise ParsingError(f"Failed to parse resume from {file_path}: {e}")
 
+    @staticmethod
+    def _content_hash(file_path: Path) -> str:
+        """Hash a resume file's bytes so identical uploads share one parse."""
+        try:
+            return hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError as e:
+            raise FileProcessingError(f"Failed to read {file_path}: {e}")
+
+    def _get_cached(self, content_hash: str, file_path: Path) -> Optional[ResumeData]:
+        """Return a copy of a cached parse, re-pointed at ``file_path``.
+
+        Checks the in-memory cache first, then the on-disk cache when enabled.
+        """
+        with self._parsed_cache_lock:
+            resume_data = self._parsed_cache.get(content_hash)
+            if resume_data is not None:
+                self._parsed_cache.move_to_end(content_hash)
+        if resume_data is None and self.cache_manager is not None:
+            resume_data = self.cache_manager.get(self._get_cache_key(content_hash))
+            if resume_data is not None:
+                self._store_cached(content_hash, resume_data, persist=False)
+        if resume_data is None:
+            return None
+        # Callers edit the returned model, so never hand out the cached one
+        return resume_data.model_copy(deep=True, update={'file_path': file_path})
+
+    def _store_cached(self, content_hash: str, resume_data: ResumeData, persist: bool = True) -> None:
+        """Cache a copy of a fresh parse, evicting the least recently used."""
+        if persist and self.cache_manager is not None:
+            self.cache_manager.set(self._get_cache_key(content_hash), resume_data)
+        with self._parsed_cache_lock:
+            self._parsed_cache[content_hash] = resume_data.model_copy(deep=True)
+            self._parsed_cache.move_to_end(content_hash)
+            while len(self._parsed_cache) > self._MAX_CACHED_RESUMES:
+                self._parsed_cache.popitem(last=False)
+
+    @staticmethod
+    def _get_cache_key(content_hash: str) -> str:
+        """Build the on-disk cache key from the file hash and extractor version."""
+        return f"{content_hash}-v{_PARSED_CACHE_VERSION}"
+
+    def _build_resume_data(self, raw_text: str, header_name: Optional[str], doc: Optional[Any],
+                           file_path: Path, file_type: FileType) -> ResumeData:
+        """Extract structured resume data from text, its header name and its spaCy doc, if any."""
+        resume_data = ResumeData(
+            raw_text=raw_text,
+            file_path=file_path,
+            file_type=file_type
+        )
+
+        # Contact and skills matching both work on one lowercased copy
+        text_lower = raw_text.lower()
+
+        # Extract contact information
+        resume_data.contact_info = self.contact_extractor.extract_with_header_name(
+            raw_text, header_name, doc, text_lower
+        )
+
+        # Extract skills
+        resume_data.skills = self.skills_extractor.extract(raw_text, doc, text_lower)
+
+        # Extract sections
+        sections = self.section_extractor.extract_sections(raw_text)
+        
+        # Extract structured experience and education
+        experience_section = sections.get('experience', '')
+        education_section = sections.get('education', '')
+        
+        # Parse experience into Experience objects
+        resume_data.experience = self.experience_extractor.extract_from_section(experience_section)
+        
+        # Parse education into Education objects
+        resume_data.education = self.education_extractor.extract_from_section(education_section)
+        
+        # Safely populate other resume data with extracted sections
+        if hasattr(resume_data, 'summary'):
+            resume_data.summary = sections.get('summary', '')
+        if hasattr(resume_data, 'certifications'):
+            resume_data.certifications = sections.get('certifications', '')
+        if hasattr(resume_data, 'projects'):
+            resume_data.projects = sections.get('projects', '')
+
+        # Check if parsing was successful (has meaningful data)
+        if self._is_parsing_successful(resume_data):
+            return resume_data
+        else:
+            self.logger.info("SpaCy parsing yielded insufficient data, afallback.")
+            raise ParsingError("Insufficient data extracted with spaCy.")
+
     def _is_parsing_successful(self, resume_data: ResumeData) -> bool:
         """Check if parsing extracted meaningful information."""
         # Consider parsing successful if we have at least some key information
@@ -492,23 +911,8 @@ class SpacyResumeParser(BaseResumeParser):
     
     def _get_file_type(self, file_path: Path) -> FileType:
         """Determine file type from extension."""
-        suffix = file_path.suffix.lower()
-        if suffix == '.pdf':
-            return FileType.PDF
-        elif suffix == '.docx':
-            return FileType.DOCX
-        elif suffix == '.txt':
-            return FileType.TXT
-        else:
-            raise ParsingError(f"Unsupported file type: {suffix}")
+        return file_type_for(file_path)
 
     def _extract_text(self, file_path: Path, file_type: FileType) -> str:
         """Extract text based on file type."""
-        if file_type == FileType.PDF:
-            return self.text_extractor.extract_from_pdf(file_path)
-        elif file_type == FileType.DOCX:
-            return self.text_extractor.extract_from_docx(file_path)
-        elif file_type == FileType.TXT:
-            return self.text_extractor.extract_from_txt(file_path)
-        else:
-            raise ParsingError(f"Unsupported file type: {file_type}")
+        return self.text_extractor.extract(file_path, file_type)
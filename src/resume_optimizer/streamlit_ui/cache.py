@@ -0,0 +1,86 @@
+"""Cached parsing and analysis entry points shared across Streamlit reruns."""
+
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+import streamlit as st
+
+from resume_optimizer.core.models import ResumeData, JobDescriptionData
+from resume_optimizer.core.resume_parser import SpacyResumeParser, GeminiResumeParser
+from resume_optimizer.core.job_analyzer import JobDescriptionAnalyzer, GeminiJobAnalyzer
+from resume_optimizer.core.ai_integration.gemini_client import GeminiClient
+from resume_optimizer.utils.exceptions import ParsingError
+
+
+def file_digest(data: bytes) -> str:
+    """Return the SHA-256 hex digest identifying a file's contents."""
+    return hashlib.sha256(data).hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_client(api_key: str) -> GeminiClient:
+    """Return one GeminiClient per API key, shared by all sessions and reruns."""
+    return GeminiClient(api_key=api_key)
+
+
+def parse_resume(file_path: str, parser_choice: str, api_key: Optional[str] = None) -> ResumeData:
+    """Parse a resume with the chosen parser.
+
+    Not wrapped in ``st.cache_data``: SpacyResumeParser already memoizes parses
+    by file contents and GeminiResumeParser caches Gemini's output on disk by
+    resume text, both skipping failed parses.
+
+    Args:
+        file_path: Path the uploaded file was saved to
+        parser_choice: "spacy" or "gemini"
+        api_key: Gemini API key, required for the Gemini parser
+
+    Returns:
+        ResumeData: Parsed resume
+
+    Raises:
+        ParsingError: If parsing fails or extracts no resume fields
+    """
+    if parser_choice == "spacy":
+        parser = SpacyResumeParser()
+    else:
+        parser = GeminiResumeParser(gemini_client=get_gemini_client(api_key))
+    resume_data = parser.parse(Path(file_path))
+
+    contact = resume_data.contact_info
+    if not (contact.name or contact.email or contact.phone or resume_data.skills
+            or resume_data.experience or resume_data.education):
+        raise ParsingError("No resume fields could be extracted")
+    return resume_data
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def analyze_job(job_text: str, analyzer_choice: str,
+                _api_key: Optional[str] = None) -> JobDescriptionData:
+    """Analyze a job description once per (text, analyzer) pair.
+
+    Arguments starting with an underscore are not part of the cache key.
+    Empty results raise instead of returning, so they are never cached.
+
+    Args:
+        job_text: Full job description text
+        analyzer_choice: "standard" or "gemini"
+        _api_key: Gemini API key, required for the Gemini analyzer
+
+    Returns:
+        JobDescriptionData: Analyzed job (a fresh copy on every call)
+
+    Raises:
+        ParsingError: If analysis fails or extracts no job fields
+    """
+    if analyzer_choice == "standard":
+        analyzer = JobDescriptionAnalyzer()
+    else:
+        analyzer = GeminiJobAnalyzer(api_key=_api_key)
+    job_data = analyzer.analyze(job_text)
+
+    if not (job_data.title or job_data.required_skills or job_data.preferred_skills
+            or job_data.keywords):
+        raise ParsingError("No job fields could be extracted")
+    return job_data
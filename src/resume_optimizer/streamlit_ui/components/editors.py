@@ -2,7 +2,6 @@
 
 import streamlit as st
 import pandas as pd
-from copy import deepcopy
 from typing import Optional
 
 from resume_optimizer.core.models import (
@@ -18,13 +17,17 @@ from resume_optimizer.core.models import (
 def render_resume_data_editor(resume_data: ResumeData) -> ResumeData:
     """Render editable form for ResumeData.
 
+    Edits are applied to ``resume_data`` in place rather than to a copy, so each
+    rerun only reassigns the edited fields. Callers pass the session's own
+    editable copy.
+
     Args:
         resume_data: ResumeData to edit
 
     Returns:
         Updated ResumeData with user edits
     """
-    data = deepcopy(resume_data)
+    data = resume_data
 
     # Contact Information
     st.subheader("👤 Contact Information")
@@ -116,24 +119,24 @@ def render_resume_data_editor(resume_data: ResumeData) -> ResumeData:
                 )
 
             # Description bullets
-            desc_df = pd.DataFrame({"Description": exp.description or []})
+            desc_df = pd.DataFrame({"Description": list(exp.description or ())})
             edited_desc = st.data_editor(
                 desc_df,
                 use_container_width=True,
                 num_rows="dynamic",
                 key=f"exp_desc_{i}"
             )
-            exp.description = edited_desc["Description"].tolist() if not edited_desc.empty else []
+            exp.description = tuple(edited_desc["Description"].tolist()) if not edited_desc.empty else ()
 
             # Skills used
-            skills_used_df = pd.DataFrame({"Skill": exp.skills_used or []})
+            skills_used_df = pd.DataFrame({"Skill": list(exp.skills_used or ())})
             edited_skills_used = st.data_editor(
                 skills_used_df,
                 use_container_width=True,
                 num_rows="dynamic",
                 key=f"exp_skills_{i}"
             )
-            exp.skills_used = edited_skills_used["Skill"].tolist() if not edited_skills_used.empty else []
+            exp.skills_used = tuple(edited_skills_used["Skill"].tolist()) if not edited_skills_used.empty else ()
 
             if st.button(f"Remove Experience {i+1}", key=f"remove_exp_{i}"):
                 data.experience.pop(i)
@@ -234,13 +237,15 @@ def render_resume_data_editor(resume_data: ResumeData) -> ResumeData:
 def render_job_data_editor(job_data: JobDescriptionData) -> JobDescriptionData:
     """Render editable form for JobDescriptionData.
 
+    Edits are applied to ``job_data`` in place, like the resume editor.
+
     Args:
         job_data: JobDescriptionData to edit
 
     Returns:
         Updated JobDescriptionData with user edits
     """
-    data = deepcopy(job_data)
+    data = job_data
 
     st.subheader("📋 Job Information")
     col1, col2 = st.columns(2)
@@ -336,13 +341,15 @@ def render_job_data_editor(job_data: JobDescriptionData) -> JobDescriptionData:
 def render_optimization_result_editor(opt_result: OptimizationResult) -> OptimizationResult:
     """Render editable form for OptimizationResult.
 
+    Edits are applied to ``opt_result`` in place, like the resume editor.
+
     Args:
         opt_result: OptimizationResult to edit
 
     Returns:
         Updated OptimizationResult with user edits
     """
-    data = deepcopy(opt_result)
+    data = opt_result
 
     # Display scores as metrics
     st.subheader("📊 Optimization Scores")
@@ -5,8 +5,7 @@ import tempfile
 from pathlib import Path
 import logging
 
-from resume_optimizer.core.resume_parser import SpacyResumeParser, GeminiResumeParser
-from resume_optimizer.core.ai_integration.gemini_client import GeminiClient
+from resume_optimizer.streamlit_ui.cache import file_digest, parse_resume
 from resume_optimizer.streamlit_ui.components.editors import render_resume_data_editor
 from resume_optimizer.streamlit_ui.components.validators import render_validation_results
 from resume_optimizer.streamlit_ui.components.common import render_navigation_buttons
@@ -54,15 +53,20 @@ def render_stage1_resume_parsing() -> None:
     )
 
     if uploaded_file is not None:
-        # Save uploaded file temporarily
+        # Save uploaded file temporarily, only when a new file was uploaded
+        # rather than on every rerun
         temp_dir = Path(tempfile.gettempdir()) / "resume_optimizer" / st.session_state.session_id
-        temp_dir.mkdir(parents=True, exist_ok=True)
         file_path = temp_dir / uploaded_file.name
+        file_hash = file_digest(uploaded_file.getbuffer())
 
-        with open(file_path, 'wb') as f:
-            f.write(uploaded_file.getbuffer())
+        if (file_hash != st.session_state.uploaded_file_hash
+                or str(file_path) != st.session_state.uploaded_file_path):
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            with open(file_path, 'wb') as f:
+                f.write(uploaded_file.getbuffer())
 
         st.session_state.uploaded_file_path = str(file_path)
+        st.session_state.uploaded_file_hash = file_hash
         st.success("✅ Resume uploaded successfully!")
 
     st.divider()
@@ -96,9 +100,8 @@ def render_stage1_resume_parsing() -> None:
                 try:
                     file_path = Path(st.session_state.uploaded_file_path)
 
-                    if st.session_state.parser_choice == "spacy":
-                        parser = SpacyResumeParser()
-                    else:
+                    api_key = None
+                    if st.session_state.parser_choice != "spacy":
                         # Gemini parser with API key from .env
                         api_key = get_gemini_api_key()
                         if not api_key:
@@ -106,10 +109,7 @@ def render_stage1_resume_parsing() -> None:
                             st.info("Please add GOOGLE_API_KEY to your .env file or select Spacy Parser instead.")
                             st.stop()
 
-                        gemini_client = GeminiClient(api_key=api_key)
-                        parser = GeminiResumeParser(gemini_client=gemini_client)
-
-                    resume_data = parser.parse(file_path)
+                    resume_data = parse_resume(str(file_path), st.session_state.parser_choice, api_key)
                     st.session_state.resume_data_raw = resume_data
                     st.session_state.resume_data_edited = resume_data.model_copy(deep=True)
 
@@ -3,7 +3,7 @@
 import streamlit as st
 import logging
 
-from resume_optimizer.core.job_analyzer import JobDescriptionAnalyzer, GeminiJobAnalyzer
+from resume_optimizer.streamlit_ui.cache import analyze_job
 from resume_optimizer.streamlit_ui.components.editors import render_job_data_editor
 from resume_optimizer.streamlit_ui.components.validators import render_validation_results
 from resume_optimizer.streamlit_ui.state.validators import validate_job_data
@@ -77,9 +77,8 @@ def render_stage2_job_analysis() -> None:
                 try:
                     job_text = st.session_state.job_description_text
 
-                    if st.session_state.analyzer_choice == "standard":
-                        analyzer = JobDescriptionAnalyzer()
-                    else:
+                    api_key = None
+                    if st.session_state.analyzer_choice != "standard":
                         # Gemini analyzer with API key from .env
                         api_key = get_gemini_api_key()
                         if not api_key:
@@ -87,9 +86,8 @@ def render_stage2_job_analysis() -> None:
                             st.info("Please add GOOGLE_API_KEY to your .env file or select Standard Analyzer instead.")
                             st.stop()
 
-                        analyzer = GeminiJobAnalyzer(api_key=api_key)
-
-                    job_data = analyzer.analyze(job_text)
+                    # Cached by job text, so re-analyzing unchanged text is free
+                    job_data = analyze_job(job_text, st.session_state.analyzer_choice, api_key)
                     st.session_state.job_data_raw = job_data
                     st.session_state.job_data_edited = job_data.model_copy(deep=True)
 
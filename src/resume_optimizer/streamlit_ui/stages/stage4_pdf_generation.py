@@ -1,11 +1,9 @@
 """Stage 4: PDF Generation implementation."""
 
 import streamlit as st
-import tempfile
-from pathlib import Path
 import logging
 
-from resume_optimizer.core.pdf_generator.generator import ATSFriendlyPDFGenerator
+from resume_optimizer.core.pdf_generator.generator import PDFGeneratorFactory
 from resume_optimizer.streamlit_ui.state.session_manager import SessionStateManager
 
 
@@ -95,22 +93,15 @@ def render_stage4_pdf_generation() -> None:
     if st.button("📥 Generate PDF", type="primary", use_container_width=True):
         with st.spinner("Generating PDF..."):
             try:
-                # Create temp directory for PDF
-                temp_dir = Path(tempfile.gettempdir()) / "resume_optimizer" / st.session_state.session_id
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                pdf_path = temp_dir / f"{st.session_state.applicant_name.replace(' ', '_')}_optimized_resume.pdf"
-
-                # Generate PDF
-                generator = ATSFriendlyPDFGenerator()
-                generator.generate_pdf(
+                # Generate PDF in memory; the download button serves the bytes directly
+                generator = PDFGeneratorFactory.create_generator()
+                st.session_state.pdf_bytes = generator.generate_pdf_bytes(
                     resume_data=st.session_state.optimization_result_edited.optimized_resume,
                     optimization_result=st.session_state.optimization_result_edited,
-                    output_path=pdf_path,
                     applicant_name=st.session_state.applicant_name,
                     company_name=st.session_state.company_name
                 )
 
-                st.session_state.pdf_path = str(pdf_path)
                 st.success("✅ PDF generated successfully!")
                 st.session_state.stage_status[3] = 'completed'
 
@@ -121,15 +112,12 @@ def render_stage4_pdf_generation() -> None:
     st.divider()
 
     # Download button
-    if st.session_state.pdf_path and Path(st.session_state.pdf_path).exists():
+    if st.session_state.pdf_bytes:
         st.subheader("⬇️ Download Resume")
 
-        with open(st.session_state.pdf_path, 'rb') as f:
-            pdf_data = f.read()
-
         st.download_button(
             label="Download PDF",
-            data=pdf_data,
+            data=st.session_state.pdf_bytes,
             file_name=f"{st.session_state.applicant_name.replace(' ', '_')}_optimized_resume.pdf",
             mime="application/pdf",
             use_container_width=True
@@ -25,6 +25,9 @@ class SessionStateManager:
         if 'uploaded_file_path' not in st.session_state:
             st.session_state.uploaded_file_path = None
 
+        if 'uploaded_file_hash' not in st.session_state:
+            st.session_state.uploaded_file_hash = None
+
         if 'parser_choice' not in st.session_state:
             st.session_state.parser_choice = 'spacy'
 
@@ -70,8 +73,8 @@ class SessionStateManager:
             st.session_state.stage3_confirmed = False
 
         # Stage 4: PDF Generation
-        if 'pdf_path' not in st.session_state:
-            st.session_state.pdf_path = None
+        if 'pdf_bytes' not in st.session_state:
+            st.session_state.pdf_bytes = None
 
         # Tracking flags for edits
         if 'resume_edited_after_confirmation' not in st.session_state:
@@ -0,0 +1,29 @@
+"""
+Shared spaCy model loading.
+"""
+
+from functools import lru_cache
+
+from .exceptions import ParsingError
+
+
+@lru_cache(maxsize=1)
+def load_spacy_model():
+    """Load the spaCy English model once per process.
+
+    Only named entities are used, so the tagger, parser, attribute ruler and
+    lemmatizer are disabled. spaCy is imported here rather than at module
+    import so that callers which never need it do not pay its start-up cost.
+
+    Raises:
+        ParsingError: If the en_core_web_sm model is not installed
+    """
+    import spacy
+
+    try:
+        return spacy.load(
+            "en_core_web_sm",
+            disable=["tagger", "parser", "attribute_ruler", "lemmatizer"],
+        )
+    except OSError:
+        raise ParsingError("spaCy English model not found. Run: python -m spacy download en_core_web_sm")
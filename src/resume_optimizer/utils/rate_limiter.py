@@ -2,6 +2,7 @@
 Rate limiting and caching utilities for API calls.
 """
 
+import os
 import time
 import hashlib
 import json
@@ -10,6 +11,8 @@ from typing import Any, Callable, Optional
 from functools import wraps
 from pathlib import Path
 import pickle
+import tempfile
+import threading
 from datetime import datetime, timedelta
 
 
@@ -34,6 +37,7 @@ class RateLimiter:
         self.last_minute_refill = time.time()
         self.last_day_refill = time.time()
         self.min_interval = 60.0 / calls_per_minute  # Minimum seconds between calls
+        self._lock = threading.Lock()
 
     def acquire(self) -> float:
         """
@@ -42,6 +46,11 @@ class RateLimiter:
         Returns:
             float: Time to wait before making the call (0 if can proceed immediately)
         """
+        with self._lock:
+            return self._acquire_locked()
+
+    def _acquire_locked(self) -> float:
+        """Token accounting for acquire(); caller must hold the lock."""
         now = time.time()
 
         # Refill minute tokens
@@ -166,24 +175,39 @@ class CacheManager:
                 'timestamp': datetime.now(),
                 'value': value
             }
-            with open(cache_path, 'wb') as f:
-                pickle.dump(cached_data, f)
+            # Write to a temp file and rename so concurrent readers never see
+            # a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(cached_data, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
 
             self.logger.debug(f"Cached value for key {cache_key[:8]}...")
 
         except Exception as e:
             self.logger.warning(f"Cache write error: {e}")
 
+    def _iter_cache_entries(self):
+        """Yield DirEntry objects for cache files without building Path objects."""
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.pkl') and entry.is_file(follow_symlinks=False):
+                    yield entry
+
     def clear(self):
         """Clear all cached items."""
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            cache_file.unlink()
+        for entry in list(self._iter_cache_entries()):
+            os.unlink(entry.path)
         self.logger.info("Cache cleared")
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        cache_files = list(self.cache_dir.glob("*.pkl"))
-        total_size = sum(f.stat().st_size for f in cache_files)
+        cache_files = list(self._iter_cache_entries())
+        total_size = sum(e.stat(follow_symlinks=False).st_size for e in cache_files)
 
         return {
             'cache_dir': str(self.cache_dir),
@@ -0,0 +1,65 @@
+"""
+Tests for Gemini-backed experience optimization with a mocked client.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from resume_optimizer.core.ats_optimizer.optimizer import GeminiResumeOptimizer
+from resume_optimizer.core.models import Experience, JobDescriptionData
+
+
+@pytest.fixture
+def optimizer():
+    with patch("resume_optimizer.core.ats_optimizer.optimizer.GeminiClient"):
+        optimizer = GeminiResumeOptimizer(api_key="test-key")
+    optimizer.gemini_client = Mock()
+    return optimizer
+
+
+@pytest.fixture
+def job_data():
+    return JobDescriptionData(title="Backend Engineer", required_skills=["Python"], keywords=["APIs"])
+
+
+def _experiences():
+    return [
+        Experience(company="Acme", position="Developer", description=("Wrote code",)),
+        Experience(company="Globex", position="Analyst", description=("Ran reports",)),
+    ]
+
+
+def test_batch_accepts_single_string_bullet(optimizer, job_data):
+    optimizer.gemini_client.invoke.return_value = json.dumps({
+        "Experience_1": "Built Python APIs",
+        "Experience_2": ["Automated reports", "Cut costs"],
+    })
+
+    result = optimizer.optimize_all_experiences_batch(_experiences(), job_data)
+
+    assert [e.description for e in result] == [
+        ("Built Python APIs",), ("Automated reports", "Cut costs"),
+    ]
+    assert result[0].company == "Acme"
+
+
+def test_batch_keeps_original_for_malformed_entry(optimizer, job_data):
+    optimizer.gemini_client.invoke.return_value = json.dumps({
+        "Experience_1": [{"bullet": "x"}],
+        "Experience_2": ["Automated reports"],
+    })
+
+    result = optimizer.optimize_all_experiences_batch(_experiences(), job_data)
+
+    assert [e.description for e in result] == [("Wrote code",), ("Automated reports",)]
+
+
+def test_single_description_is_a_tuple(optimizer, job_data):
+    optimizer.gemini_client.invoke.return_value = "• Built APIs\n- Shipped features"
+    description = optimizer.optimize_experience_description(_experiences()[0], job_data)
+    assert description == ("Built APIs", "Shipped features")
+
+    optimizer.gemini_client.invoke.side_effect = RuntimeError("quota")
+    assert optimizer.optimize_experience_description(_experiences()[0], job_data) == ("Wrote code",)
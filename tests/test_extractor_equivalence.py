@@ -0,0 +1,219 @@
+"""
+Equivalence tests for the single-pass resume field extractors.
+
+Each extractor is checked against the original per-pattern implementation
+(kept below as a reference) on seeded random inputs built from resume-like
+fragments, so any difference is reproducible from the seed.
+"""
+
+import random
+import re
+
+import pytest
+
+from resume_optimizer.core.resume_parser import parser
+from resume_optimizer.core.resume_parser.parser import (
+    ContactInfoExtractor, EducationExtractor, ExperienceExtractor, SectionExtractor, SkillsExtractor,
+)
+
+SEED = 20240611
+CASES = 400
+
+_WHITESPACE = [' ', ' ', '  ', '\t', '\n', '\n', '\n\n', ' \r\n']
+
+
+def _random_text(rng: random.Random, fragments, max_pieces: int = 30) -> str:
+    return ''.join(
+        rng.choice(fragments) + rng.choice(_WHITESPACE)
+        for _ in range(rng.randint(0, max_pieces))
+    )
+
+
+# Reference implementations, as they were before the extractors were fused
+
+_PHONE_PATTERNS = [
+    re.compile(r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'),  # US
+    re.compile(r'\b(?:\+?91[-.\s]?)?[6-9][0-9]{9}\b'),  # India
+    re.compile(r'\b(?:\+?[1-9][0-9]{0,3}[-.\s]?)?[0-9]{4,14}\b'),  # General international
+]
+
+
+def reference_phone(text):
+    for pattern in _PHONE_PATTERNS:
+        phone_match = pattern.search(text)
+        if phone_match:
+            phone = re.sub(r'[^\d+]', '', phone_match.group())
+            if len(phone) >= 10:
+                return phone_match.group()
+    return None
+
+
+def reference_skills(extractor, text):
+    text_lower = text.lower()
+    found_skills = set()
+    for skill in extractor.tech_skills:
+        if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
+            found_skills.add(skill.title())
+    for alias, full_skill in extractor.skill_aliases.items():
+        if re.search(r'\b' + re.escape(alias.lower()) + r'\b', text_lower) and full_skill in extractor.tech_skills:
+            found_skills.add(full_skill.title())
+    return sorted(found_skills)
+
+
+def reference_sections(extractor, text):
+    def detect(line):
+        if len(line) > 50:
+            return None
+        for section, patterns in extractor.section_patterns.items():
+            for pattern in patterns:
+                if re.search(pattern, line, re.IGNORECASE):
+                    return section
+        return None
+
+    sections = {}
+    current_section = None
+    current_content = []
+    for line in [line.strip() for line in text.split('\n') if line.strip()]:
+        detected_section = detect(line.lower())
+        if detected_section:
+            if current_section and current_content:
+                sections[current_section] = '\n'.join(current_content).strip()
+            current_section = detected_section
+            current_content = []
+        elif current_section:
+            current_content.append(line)
+    if current_section and current_content:
+        sections[current_section] = '\n'.join(current_content).strip()
+    return sections
+
+
+def _first_group(patterns, text, flags=0):
+    for pattern in patterns:
+        match = re.search(pattern.pattern, text, flags)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def reference_experience(extractor, section_text):
+    entries = []
+    for line in [line.strip() for line in section_text.split('\n') if line.strip()]:
+        company = _first_group(extractor.company_patterns, line)
+        position = _first_group(extractor.position_patterns, line, re.IGNORECASE)
+        duration = extractor.duration_pattern.search(line)
+        if company or position or duration:
+            entries.append((company or "", position or "", duration.group() if duration else "", []))
+        elif entries and not (len(line) < 50 and any(
+                keyword in line.lower() for keyword in ['experience', 'education', 'skills'])):
+            entries[-1][3].append(line)
+    return entries
+
+
+def reference_education(extractor, section_text):
+    entries = []
+    for line in [line.strip() for line in section_text.split('\n') if line.strip()]:
+        degree = _first_group(extractor.degree_patterns, line, re.IGNORECASE)
+        institution = _first_group(extractor.institution_patterns, line, re.IGNORECASE)
+        year = extractor.year_pattern.search(line)
+        if degree or institution or year:
+            entries.append((degree or "", institution or "", []))
+        elif entries:
+            entries[-1][2].append(line)
+    return entries
+
+
+# Fragments
+
+_WORDS = ['and', 'with', 'team', 'built', 'the', 'data', 'cloud', 'Led', 'of', 'at', '@', '-', ',', '.', '/', '(', ')']
+
+_PHONE_FRAGMENTS = _WORDS + [
+    '555-123-4567', '(555) 123-4567', '+1 555.123.4567', '15551234567', '9876543210', '+91 9876543210',
+    '+91-6123456789', '+44 2079460958', '+4420794609', '12345', '2020', '123456789', '1234567890123',
+    '+1', '555', '-4567', 'Phone:', 'Tel', 'x',
+]
+
+_SKILL_FRAGMENTS = _WORDS + [
+    'Python', 'python3', 'C', 'C++', 'C++17', 'c#', 'C#net', 'C/C++', 'R', 'Go', 'golang', 'JS', 'TS',
+    'py', 'ML', 'AI', 'k8s', 'Node.js', 'node', 'Next.js', 'CI/CD', 'REST API', 'rest apis', 'Machine Learning',
+    'machine-learning', 'Deep  Learning', 'scikit-learn', 'Scikit', 'Spring', 'springboot', 'Git',
+    'GitHub', 'Shell', 'bash_scripts', 'Vue', 'React', 'ReactJS', 'AWS', 'gcp', 'Data Science',
+    'DevOps', 'ci', 'cd', 'c_', '_c', 'e.g.', 'postgresql', 'Spark', 'TensorFlow',
+]
+
+_SECTION_FRAGMENTS = _WORDS + [
+    'SUMMARY', 'Professional Summary', 'Profile', 'About Me', 'Objective', 'Career Objective', 'Overview',
+    'Experience', 'WORK EXPERIENCE', 'Work History', 'Employment', 'Education', 'Academic Background',
+    'Qualifications', 'Degrees', 'Skills', 'Technical Skills', 'Competencies', 'Technologies',
+    'Certifications', 'Certificate', 'Licenses', 'Projects', 'Key Projects', 'Portfolio',
+    'Developed a scalable platform used by thousands of customers across the world',
+    'Python', 'Jane Doe', 'Acme Corp', '2019 - 2021',
+]
+
+_EXPERIENCE_FRAGMENTS = _WORDS + [
+    'Senior Software Engineer', 'Software Engineer', 'Developer', 'data scientist', 'Lead Analyst',
+    'Full Stack Developer', 'Machine Learning Engineer', 'Principal Consultant', 'Director',
+    'at Google', '@ Acme', 'Acme Corp', 'Initech LLC', 'Globex Inc', 'Umbrella Ltd', 'Example Company',
+    '2018 - 2020', '2019–Present', '2020 — current', '2021-2022', 'Jan 2020', '2019',
+    'Built APIs', 'Improved latency by 40%', 'Skills', 'Education', 'Experience',
+    'Mentored junior engineers on experience with deployment and testing',
+]
+
+_EDUCATION_FRAGMENTS = _WORDS + [
+    'Bachelor of Science', 'Master of Arts', 'PhD', 'B.S.', 'M.S.', 'BS', 'MA', 'B.Tech', 'MTech', 'MBA',
+    'BBA', 'University of California', 'Stanford University', 'MIT Institute', 'Springfield College',
+    'High School', 'School of Engineering', '2015', '2015 - 2019', 'GPA 3.8', 'Dean\'s List',
+    'Coursework', 'Computer Science', 'honors', 'thesis',
+]
+
+
+def test_phone_matches_reference():
+    rng = random.Random(SEED)
+    extractor = ContactInfoExtractor()
+    for _ in range(CASES):
+        text = _random_text(rng, _PHONE_FRAGMENTS, max_pieces=8)
+        assert extractor.extract(text, None).phone == reference_phone(text), repr(text)
+
+
+@pytest.fixture(params=["regex", "automaton"])
+def skills_extractor(request):
+    extractor = SkillsExtractor()
+    if request.param == "regex":
+        extractor._skill_automaton = None
+    elif parser.ahocorasick is None:
+        pytest.skip("pyahocorasick is not installed")
+    return extractor
+
+
+def test_skills_match_reference(skills_extractor):
+    rng = random.Random(SEED)
+    for _ in range(CASES):
+        text = _random_text(rng, _SKILL_FRAGMENTS)
+        assert skills_extractor.extract(text, None) == reference_skills(skills_extractor, text), repr(text)
+
+
+def test_sections_match_reference():
+    rng = random.Random(SEED)
+    extractor = SectionExtractor()
+    for _ in range(CASES):
+        text = _random_text(rng, _SECTION_FRAGMENTS)
+        assert extractor.extract_sections(text) == reference_sections(extractor, text), repr(text)
+
+
+def test_experience_matches_reference():
+    rng = random.Random(SEED)
+    extractor = ExperienceExtractor()
+    for _ in range(CASES):
+        text = _random_text(rng, _EXPERIENCE_FRAGMENTS, max_pieces=20)
+        actual = [(e.company, e.position, e.duration, list(e.description))
+                  for e in extractor.extract_from_section(text)]
+        assert actual == reference_experience(extractor, text), repr(text)
+
+
+def test_education_matches_reference():
+    rng = random.Random(SEED)
+    extractor = EducationExtractor()
+    for _ in range(CASES):
+        text = _random_text(rng, _EDUCATION_FRAGMENTS, max_pieces=20)
+        actual = [(e.degree, e.institution, list(e.description))
+                  for e in extractor.extract_from_section(text)]
+        assert actual == reference_education(extractor, text), repr(text)
@@ -0,0 +1,47 @@
+"""
+Tests for the Gemini resume response schemas.
+
+The schemas are checked the way they are sent: through google-genai's
+GenerationConfig and langchain-google-genai's request preparation. No API
+calls are made.
+"""
+
+import pytest
+
+from google.genai import types
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from resume_optimizer.core.resume_parser.GeminiParser import (
+    RESUME_RESPONSE_SCHEMA,
+    RESUME_BATCH_RESPONSE_SCHEMA,
+)
+
+
+SCHEMAS = [RESUME_RESPONSE_SCHEMA, RESUME_BATCH_RESPONSE_SCHEMA]
+
+
+@pytest.mark.parametrize("schema", SCHEMAS, ids=["single", "batch"])
+def test_schema_is_valid_generation_config(schema):
+    """The schema should validate as a google-genai response schema."""
+    config = types.GenerationConfig.model_validate({
+        "response_mime_type": "application/json",
+        "response_schema": schema,
+    })
+    assert config.response_schema is not None
+
+
+@pytest.mark.parametrize("schema", SCHEMAS, ids=["single", "batch"])
+def test_schema_passes_langchain_request_preparation(schema):
+    """GeminiClient passes the schema through generation_config; it must not fail there."""
+    chat = ChatGoogleGenerativeAI(model="gemini-2.5-flash-lite", google_api_key="test-key")
+    config = chat._prepare_params(
+        stop=None,
+        generation_config={"response_mime_type": "application/json", "response_schema": schema},
+    )
+    assert config.response_schema is not None
+
+
+def test_optional_fields_are_nullable_strings():
+    """Optional scalar fields are nullable strings, not a type list."""
+    name = RESUME_RESPONSE_SCHEMA["properties"]["Name"]
+    assert name == {"type": "string", "nullable": True}
@@ -0,0 +1,22 @@
+"""
+Tests for the core data models.
+"""
+
+from resume_optimizer.core.models import ResumeData
+
+
+def test_flattening_does_not_affect_equality():
+    """Memoized flatten results must not make a model differ from its copy."""
+    resume = ResumeData(summary="Backend engineer", skills=["Python", "AWS, Docker"])
+    assert resume.flat_skills() == ["Python", "AWS", "Docker"]
+    assert resume.flat_summary() == "Backend engineer"
+    assert resume == resume.model_copy(deep=True)
+
+
+def test_flat_skills_follows_updates():
+    resume = ResumeData(skills=["Python"])
+    assert resume.flat_skills() == ["Python"]
+    resume.skills = ["Go | Rust"]
+    assert resume.flat_skills() == ["Go", "Rust"]
+    resume.flat_skills().append("mutated")
+    assert resume.flat_skills() == ["Go", "Rust"]
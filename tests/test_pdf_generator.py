@@ -0,0 +1,57 @@
+"""
+Tests for the ATS-friendly PDF generator.
+"""
+
+import pytest
+
+from resume_optimizer.core.models import ResumeData, ContactInfo, Experience, Education
+from resume_optimizer.core.pdf_generator.generator import ATSFriendlyPDFGenerator
+from resume_optimizer.utils.exceptions import FileProcessingError
+
+
+MARKUP = "<b>R&D <i>lead"
+
+
+def _markup_resume() -> ResumeData:
+    """A resume with unbalanced ReportLab markup in every rendered text field."""
+    return ResumeData(
+        contact_info=ContactInfo(
+            name=MARKUP, email="r&d@example.com", phone=MARKUP, address=MARKUP,
+            linkedin=MARKUP, github=MARKUP
+        ),
+        summary=MARKUP,
+        skills=[MARKUP, "Python"],
+        experience=[Experience(
+            company=MARKUP, position=MARKUP, start_date=MARKUP, end_date=MARKUP,
+            description=(MARKUP,)
+        )],
+        education=[Education(
+            institution=MARKUP, degree=MARKUP, field=MARKUP,
+            graduation_date=MARKUP, gpa=MARKUP
+        )],
+        certifications=[MARKUP],
+    )
+
+
+def test_user_text_is_rendered_literally():
+    """Markup characters in resume text must not break the build."""
+    pdf = ATSFriendlyPDFGenerator().generate_pdf_bytes(_markup_resume(), None, "", "Acme")
+    assert pdf.startswith(b"%PDF")
+
+
+def test_generate_pdf_writes_file(tmp_path):
+    output = tmp_path / "resume.pdf"
+    result = ATSFriendlyPDFGenerator().generate_pdf(_markup_resume(), None, output, MARKUP, "Acme")
+    assert result == output
+    assert output.read_bytes().startswith(b"%PDF")
+
+
+def test_failed_build_leaves_no_file(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("layout error")
+
+    monkeypatch.setattr(ATSFriendlyPDFGenerator, "build_story", fail)
+    output = tmp_path / "resume.pdf"
+    with pytest.raises(FileProcessingError):
+        ATSFriendlyPDFGenerator().generate_pdf(_markup_resume(), None, output, "Jane", "Acme")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,80 @@
+"""
+Tests for the spaCy resume parser's header name detection.
+
+spaCy itself is replaced by a stub pipeline, so these tests run without the
+en_core_web_sm model and check which resumes are sent to NER.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from resume_optimizer.core.resume_parser.parser import ContactInfoExtractor, SpacyResumeParser
+
+
+class StubNLP:
+    """Minimal stand-in for a spaCy pipeline that tags one PERSON entity."""
+
+    def __init__(self, person: str):
+        self.person = person
+        self.texts = []
+
+    def pipe(self, texts, batch_size=32):
+        for text in texts:
+            self.texts.append(text)
+            ent = Mock(text=self.person, label_="PERSON", start_char=0)
+            yield Mock(ents=[ent])
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Jane Doe\njane@example.com", "Jane Doe"),
+    ("\n\n  Mary Ann Smith  \nSoftware Engineer", "Mary Ann Smith"),
+])
+def test_name_taken_from_first_line(text, expected):
+    assert ContactInfoExtractor.extract_name_heuristic(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "JANE DOE\nAccount Executive",
+    "JOHN SMITH\nSan Francisco",
+    "J. Smith\nMarketing Coordinator",
+    "Employment History\nAcme Corp",
+    "Professional Summary\nJohn Smith",
+    "jane@example.com\nJane Doe",
+])
+def test_no_name_unless_first_line_is_a_name(text):
+    assert ContactInfoExtractor.extract_name_heuristic(text) is None
+
+
+def test_ner_used_when_first_line_is_not_a_name():
+    doc = Mock(ents=[Mock(text="JANE DOE", label_="PERSON", start_char=0)])
+    contact = ContactInfoExtractor().extract("JANE DOE\nAccount Executive", doc)
+    assert contact.name == "JANE DOE"
+
+
+def test_parse_many_sends_only_unnamed_headers_to_ner(tmp_path):
+    named = tmp_path / "named.txt"
+    named.write_text("Jane Doe\njane@example.com\nSkills\nPython, Docker\n")
+    caps = tmp_path / "caps.txt"
+    caps.write_text("JOHN SMITH\nSan Francisco\njohn@example.com\nSkills\nPython, AWS\n")
+
+    nlp = StubNLP("JOHN SMITH")
+    with patch("resume_optimizer.core.resume_parser.parser.load_spacy_model", return_value=nlp):
+        results = SpacyResumeParser().parse_many([named, caps])
+
+    assert [r.contact_info.name for r in results] == ["Jane Doe", "JOHN SMITH"]
+    assert len(nlp.texts) == 1
+    assert nlp.texts[0].startswith("JOHN SMITH")
+
+
+def test_parse_many_runs_name_heuristic_once_per_resume(tmp_path):
+    named = tmp_path / "named.txt"
+    named.write_text("Ada Lovelace\nada@example.com\nSkills\nPython, Rust\n")
+    caps = tmp_path / "caps.txt"
+    caps.write_text("ALAN TURING\nalan@example.com\nSkills\nPython, Go\n")
+
+    heuristic = Mock(wraps=ContactInfoExtractor.extract_name_heuristic)
+    with patch("resume_optimizer.core.resume_parser.parser.load_spacy_model", return_value=StubNLP("ALAN TURING")), \
+            patch.object(ContactInfoExtractor, "extract_name_heuristic", heuristic):
+        SpacyResumeParser().parse_many([named, caps])
+
+    assert heuristic.call_count == 2